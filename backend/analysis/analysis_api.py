@@ -0,0 +1,27 @@
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
+
+from backend.analysis.pipeline import analyze_sentences
+
+MAX_BATCH_SENTENCES = 1000
+
+router = APIRouter()
+
+
+class BatchAnalysisRequest(BaseModel):
+    sentences: list[str]
+
+
+@router.post("/analyze-batch")
+async def analyze_batch(request: BatchAnalysisRequest):
+    sentences = [sentence.strip() for sentence in request.sentences if sentence.strip()]
+
+    if not sentences:
+        raise HTTPException(status_code=400, detail="No sentences to analyze.")
+    if len(sentences) > MAX_BATCH_SENTENCES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BATCH_SENTENCES} sentences per batch.",
+        )
+
+    return await analyze_sentences(sentences)
@@ -0,0 +1,336 @@
+import re
+import json
+import time
+import asyncio
+import unicodedata
+
+from backend.analysis.result_cache import RESULT_CACHE_ENABLED, analysis_result_cache
+from backend.analysis.stage_graph import Stage, elapsed_ms, run_stage_graph
+from backend.gpt.config import UNIFIED_ENRICHMENT
+from backend.gpt.hanja_batcher import generate_hanja_for_words, stream_hanja_for_words
+from backend.gpt.korean_analyzer import (
+    generate_sentence_gloss,
+    generate_sentence_glosses,
+    generate_word_definitions,
+    stream_word_definitions,
+)
+from backend.gpt.word_enricher import enrich_words, stream_enriched_words
+from backend.gpt.word_store import merge_in_word_order
+
+from backend.language_analysis.linguistic_processing.filtering import (
+    filter_korean_tokens,
+    filter_korean_tokens_many,
+)
+from backend.language_analysis.word_extraction import (
+    extract_candidate_korean_words,
+    tag_if_derived_by_substring,
+)
+
+from backend.language_analysis.romanizer import romanize
+from backend.metrics import STAGE_LATENCY
+from backend.tracing import trace_event
+
+STAGE_PROGRESS = {
+    "romanization": "Generated romanization",
+    "gloss": "Created sentence gloss",
+    "tokenization": "Tokenized input and identified Korean word candidates",
+    "enrichment": "Generated Hanja annotations and Korean word definitions",
+    "hanja": "Generated Hanja annotations for base Korean words",
+    "definitions": "Created Korean word definitions",
+}
+
+
+def normalize_analysis_input(text: str) -> str:
+    """Unicode-normalize and collapse whitespace so equivalent inputs share one key."""
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFC", text)).strip()
+
+
+async def extract_korean_word_candidates(input_text: str) -> list[dict]:
+    tokens = await filter_korean_tokens(input_text)
+    trace_event("tokens", tokens)
+
+    candidate_words = extract_candidate_korean_words(tokens)
+    trace_event("candidate_words", candidate_words)
+
+    tagged_candidates = tag_if_derived_by_substring(candidate_words)
+    trace_event("tagged_candidates", tagged_candidates)
+    return tagged_candidates
+
+
+async def extract_korean_word_candidates_many(input_texts: list[str]) -> list[list[dict]]:
+    tokens_per_text = await filter_korean_tokens_many(input_texts)
+    return [
+        tag_if_derived_by_substring(extract_candidate_korean_words(tokens))
+        for tokens in tokens_per_text
+    ]
+
+
+def select_base_korean_words(tagged_candidates: list[dict]) -> list[str]:
+    base_words = [
+        entry["korean"]
+        for entry in tagged_candidates
+        if not entry["is_derived"]
+    ]
+    trace_event("base_words", base_words)
+    return base_words
+
+
+def select_definition_words(tagged_candidates: list[dict]) -> list[str]:
+    derived_base_forms = {
+        entry["base_form"]
+        for entry in tagged_candidates
+        if entry["is_derived"]
+    }
+
+    definition_words = [
+        entry["korean"]
+        for entry in tagged_candidates
+        if entry["is_derived"] or entry["korean"] not in derived_base_forms
+    ]
+
+    trace_event("definition_words", definition_words)
+    return definition_words
+
+
+def build_analysis_result(
+    sentence_gloss: str,
+    romanized: str,
+    hanja_words: list[dict],
+    korean_word_info: list[dict],
+    timings: dict[str, int] | None = None,
+) -> dict:
+    result = {
+        "sentence_gloss": sentence_gloss,
+        "romanization": romanized,
+        "hanja_words": hanja_words,
+        "word_info": korean_word_info,
+    }
+    if timings is not None:
+        result["timings"] = timings
+    return result
+
+
+def is_complete_result(result: dict, base_words: list[str], definition_words: list[str]) -> bool:
+    """
+    Whether the gloss and every requested word came back. A failed or partial GPT
+    call leaves gaps, and such results must not be cached and replayed.
+    """
+    resolved_hanja = {entry.get("korean") for entry in result["hanja_words"]}
+    resolved_info = {entry.get("word") for entry in result["word_info"]}
+    return (
+        bool(result["sentence_gloss"])
+        and all(word in resolved_hanja for word in base_words)
+        and all(word in resolved_info for word in definition_words)
+    )
+
+
+def format_sse_event(event: str, data) -> str:
+    if not isinstance(data, str):
+        data = json.dumps(data, ensure_ascii=False)
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+async def collect_word_stream(stream, emit) -> dict[str, dict]:
+    """Forward each ("hanja" | "word", entry) pair as it arrives and index them by word."""
+    collected: dict[str, dict] = {"hanja": {}, "word": {}}
+
+    async for kind, payload in stream:
+        word = payload["korean"] if kind == "hanja" else payload["word"]
+        collected[kind][word] = payload
+        emit(kind, payload)
+
+    return collected
+
+
+def build_analysis_stages(input_text: str) -> list[Stage]:
+    """
+    Romanization, gloss and the tokenization chain only need the raw input and start at once;
+    Hanja and definitions start as soon as candidate extraction finishes.
+    """
+
+    async def run_romanization(emit):
+        romanized = romanize(input_text)
+        emit("romanization", romanized)
+        return romanized
+
+    async def run_gloss(emit):
+        sentence_gloss = await generate_sentence_gloss(input_text)
+        if sentence_gloss:
+            emit("gloss", sentence_gloss)
+        return sentence_gloss
+
+    async def run_tokenization(emit):
+        tagged_candidates = await extract_korean_word_candidates(input_text)
+        return (
+            select_base_korean_words(tagged_candidates),
+            select_definition_words(tagged_candidates),
+        )
+
+    stages = [
+        Stage("romanization", run_romanization),
+        Stage("gloss", run_gloss),
+        Stage("tokenization", run_tokenization),
+    ]
+
+    if UNIFIED_ENRICHMENT:
+
+        async def run_enrichment(emit, tokenization):
+            base_korean_words, derived_korean_words = tokenization
+            return await collect_word_stream(
+                stream_enriched_words(base_korean_words, derived_korean_words), emit
+            )
+
+        stages.append(Stage("enrichment", run_enrichment, ("tokenization",)))
+    else:
+
+        async def run_hanja(emit, tokenization):
+            base_korean_words, _ = tokenization
+            return await collect_word_stream(
+                stream_hanja_for_words(base_korean_words), emit
+            )
+
+        async def run_definitions(emit, tokenization):
+            _, derived_korean_words = tokenization
+            return await collect_word_stream(
+                stream_word_definitions(derived_korean_words), emit
+            )
+
+        stages.append(Stage("hanja", run_hanja, ("tokenization",)))
+        stages.append(Stage("definitions", run_definitions, ("tokenization",)))
+
+    return stages
+
+
+def format_progress_event(message: str, duration_ms: int) -> str:
+    return format_sse_event("progress", f"{message} ({duration_ms} ms)")
+
+
+async def analyze_generator(input_text: str):
+    request_started_at = time.perf_counter()
+    cache_key = normalize_analysis_input(input_text)
+
+    if RESULT_CACHE_ENABLED:
+        cached = analysis_result_cache.get(cache_key)
+        if cached is not None:
+            timings = {"total_ms": elapsed_ms(request_started_at)}
+            yield format_sse_event("result", {**cached, "timings": timings})
+            return
+
+    results = {}
+    timings: dict[str, int] = {}
+
+    async for item in run_stage_graph(build_analysis_stages(input_text)):
+        if item[0] == "event":
+            _, kind, payload = item
+            yield format_sse_event(kind, payload)
+            continue
+
+        _, stage, result, duration_ms = item
+        results[stage] = result
+        timings[f"{stage}_ms"] = duration_ms
+        STAGE_LATENCY.observe(duration_ms / 1000, stage=stage)
+        yield format_progress_event(STAGE_PROGRESS[stage], duration_ms)
+
+    hanja_by_word: dict[str, dict] = {}
+    info_by_word: dict[str, dict] = {}
+    for stage in ("enrichment", "hanja", "definitions"):
+        if stage in results:
+            hanja_by_word.update(results[stage]["hanja"])
+            info_by_word.update(results[stage]["word"])
+
+    base_korean_words, derived_korean_words = results["tokenization"]
+    timings["total_ms"] = elapsed_ms(request_started_at)
+
+    result = build_analysis_result(
+        results["gloss"],
+        results["romanization"],
+        merge_in_word_order(base_korean_words, hanja_by_word, []),
+        merge_in_word_order(derived_korean_words, info_by_word, []),
+        timings,
+    )
+
+    if RESULT_CACHE_ENABLED and is_complete_result(
+        result, base_korean_words, derived_korean_words
+    ):
+        # timings describe this run only, a replay reports its own
+        analysis_result_cache.set(
+            cache_key, {key: value for key, value in result.items() if key != "timings"}
+        )
+
+    yield format_sse_event("result", result)
+
+
+async def enrich_word_lists(
+    hanja_words: list[str], definition_words: list[str]
+) -> tuple[list[dict], list[dict]]:
+    if UNIFIED_ENRICHMENT:
+        return await enrich_words(hanja_words, definition_words)
+
+    hanja_entries, word_info = await asyncio.gather(
+        generate_hanja_for_words(hanja_words),
+        generate_word_definitions(definition_words),
+    )
+    return hanja_entries, word_info
+
+
+async def analyze_sentences(sentences: list[str]) -> dict:
+    """
+    Analyze many sentences (e.g. every chunk of a transcript) at once.
+    Tokenization and glossing run in bulk, and candidate words are deduped across
+    all sentences so each word is enriched once.
+    """
+    request_started_at = time.perf_counter()
+    timings: dict[str, int] = {}
+
+    async def timed(stage: str, coroutine):
+        started_at = time.perf_counter()
+        result = await coroutine
+        timings[f"{stage}_ms"] = elapsed_ms(started_at)
+        STAGE_LATENCY.observe(timings[f"{stage}_ms"] / 1000, stage=f"batch_{stage}")
+        return result
+
+    unique_sentences = list(dict.fromkeys(sentences))
+    glosses, tagged_per_sentence = await asyncio.gather(
+        timed("gloss", generate_sentence_glosses(unique_sentences)),
+        timed("tokenization", extract_korean_word_candidates_many(unique_sentences)),
+    )
+
+    base_per_sentence = [select_base_korean_words(t) for t in tagged_per_sentence]
+    definition_per_sentence = [select_definition_words(t) for t in tagged_per_sentence]
+
+    all_base_words = list(dict.fromkeys(w for words in base_per_sentence for w in words))
+    all_definition_words = list(
+        dict.fromkeys(w for words in definition_per_sentence for w in words)
+    )
+
+    hanja_entries, word_info = await timed(
+        "enrichment", enrich_word_lists(all_base_words, all_definition_words)
+    )
+    # the unbatched generators also pass back entries GPT returned for words we never asked about
+    hanja_by_word = {
+        entry["korean"]: entry for entry in hanja_entries if entry.get("korean") is not None
+    }
+    info_by_word = {entry["word"]: entry for entry in word_info if entry.get("word") is not None}
+
+    result_by_sentence = {}
+    for sentence, gloss, base_words, definition_words in zip(
+        unique_sentences, glosses, base_per_sentence, definition_per_sentence
+    ):
+        result = build_analysis_result(
+            gloss,
+            romanize(sentence),
+            merge_in_word_order(base_words, hanja_by_word, []),
+            merge_in_word_order(definition_words, info_by_word, []),
+        )
+        result_by_sentence[sentence] = {
+            "input": sentence,
+            **result,
+            "complete": is_complete_result(result, base_words, definition_words),
+        }
+
+    timings["total_ms"] = elapsed_ms(request_started_at)
+    return {
+        "results": [result_by_sentence[sentence] for sentence in sentences],
+        "unique_words": len(set(all_base_words) | set(all_definition_words)),
+        "timings": timings,
+    }
@@ -0,0 +1,77 @@
+import os
+
+from backend.analysis.pipeline import (
+    analyze_generator,
+    analyze_sentences,
+    format_sse_event,
+    normalize_analysis_input,
+)
+from backend.analysis.result_cache import PIPELINE_VERSION
+from backend.gpt.disk_cache import DiskCache
+
+PREANALYZE_TRANSCRIPTS = os.getenv("PREANALYZE_TRANSCRIPTS", "0") == "1"
+PREANALYSIS_STORE_PATH = os.getenv("PREANALYSIS_STORE_PATH", "preanalysis.sqlite3")
+PREANALYSIS_MAX_ENTRIES = int(os.getenv("PREANALYSIS_MAX_ENTRIES", "200000"))
+PREANALYSIS_TTL_SECONDS = float(os.getenv("PREANALYSIS_TTL_SECONDS", str(30 * 24 * 3600)))
+# sentences per analyze_sentences call, so one long video doesn't hold everything in memory
+PREANALYSIS_BATCH_SENTENCES = 100
+
+# keyed by normalized text: that is all /analyze-stream receives from a subtitle click
+text_analysis_store = DiskCache(
+    PREANALYSIS_STORE_PATH,
+    table="text_analyses",
+    max_entries=PREANALYSIS_MAX_ENTRIES,
+    ttl_seconds=PREANALYSIS_TTL_SECONDS,
+)
+
+
+# keys carry PIPELINE_VERSION, so rule, dictionary or prompt edits invalidate
+# pre-analyzed chunks just like they invalidate the result cache
+def build_text_key(input_text: str) -> str:
+    return f"{PIPELINE_VERSION}:{normalize_analysis_input(input_text)}"
+
+
+def get_preanalyzed_result(input_text: str) -> dict | None:
+    return text_analysis_store.get(build_text_key(input_text))
+
+
+async def preanalyze_transcript_chunks(chunks: list[dict]) -> None:
+    """Background task: analyze every transcript chunk and store the results."""
+    pending = [
+        chunk
+        for chunk in chunks
+        if chunk.get("text") and text_analysis_store.get(build_text_key(chunk["text"])) is None
+    ]
+    print(f"Pre-analyzing {len(pending)} of {len(chunks)} transcript chunks")
+
+    for i in range(0, len(pending), PREANALYSIS_BATCH_SENTENCES):
+        batch = pending[i:i + PREANALYSIS_BATCH_SENTENCES]
+        try:
+            analysis = await analyze_sentences([chunk["text"] for chunk in batch])
+        except Exception as e:
+            print(f"⚠️ Pre-analysis failed for chunks {i}-{i + len(batch)}: {e}")
+            continue
+
+        by_text = {}
+        for chunk, result in zip(batch, analysis["results"]):
+            # a failed GPT batch leaves gaps; those chunks are analyzed live instead
+            if not result["complete"]:
+                continue
+            result = {
+                key: value for key, value in result.items() if key not in ("input", "complete")
+            }
+            by_text[build_text_key(chunk["text"])] = result
+
+        text_analysis_store.set_many(by_text)
+
+
+async def analyze_with_preanalysis(input_text: str):
+    """`analyze_generator`, except pre-analyzed transcript chunks are replayed instantly."""
+    result = get_preanalyzed_result(input_text)
+    if result is None:
+        async for event in analyze_generator(input_text):
+            yield event
+        return
+
+    yield format_sse_event("progress", "Loaded pre-analyzed result")
+    yield format_sse_event("result", result)
@@ -0,0 +1,119 @@
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+
+from backend.gpt.config import FUSED_PREPROCESSING, UNIFIED_ENRICHMENT
+from backend.gpt.disk_cache import DiskCache
+
+RESULT_CACHE_ENABLED = os.getenv("RESULT_CACHE_ENABLED", "1") == "1"
+RESULT_CACHE_MAX_ENTRIES = int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "1024"))
+# optional second tier that survives restarts
+RESULT_CACHE_DISK = os.getenv("RESULT_CACHE_DISK", "0") == "1"
+RESULT_CACHE_PATH = os.getenv("RESULT_CACHE_PATH", "analysis_results.sqlite3")
+RESULT_CACHE_DISK_MAX_ENTRIES = int(os.getenv("RESULT_CACHE_DISK_MAX_ENTRIES", "50000"))
+RESULT_CACHE_DISK_TTL_SECONDS = float(
+    os.getenv("RESULT_CACHE_DISK_TTL_SECONDS", str(30 * 24 * 3600))
+)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(__file__))
+
+# Everything that can change an analysis result for the same input:
+# grammar rules, the Komoran user dictionary, and the modules holding GPT prompts.
+PIPELINE_FILES = [
+    "language_analysis/linguistic_processing/auxiliary_grammar_rules.yaml",
+    "language_analysis/linguistic_processing/user.dic",
+    "gpt/openai_client.py",
+    "gpt/fused_preprocessor.py",
+    "gpt/spacing_normalizer.py",
+    "gpt/idiom_detector.py",
+    "gpt/korean_analyzer.py",
+    "gpt/hanja_batcher.py",
+    "gpt/word_enricher.py",
+]
+
+
+def compute_pipeline_version(files: list[str] = PIPELINE_FILES) -> str:
+    digest = hashlib.sha256()
+    digest.update(f"fused={FUSED_PREPROCESSING};unified={UNIFIED_ENRICHMENT}".encode())
+    for relative_path in files:
+        digest.update(relative_path.encode())
+        path = os.path.join(BACKEND_DIR, relative_path)
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+# Rules, dictionary and prompts are all loaded at import, so this is fixed per process;
+# a restart after editing any of them starts from a fresh key space.
+PIPELINE_VERSION = compute_pipeline_version()
+
+
+class ResultCache:
+    """Bounded in-memory LRU of final analysis results, optionally backed by a DiskCache."""
+
+    def __init__(self, max_entries: int, disk: DiskCache | None = None, version: str = PIPELINE_VERSION):
+        self.max_entries = max_entries
+        self.disk = disk
+        self.version = version
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def build_key(self, normalized_text: str) -> str:
+        return hashlib.sha256(f"{self.version}\0{normalized_text}".encode("utf-8")).hexdigest()
+
+    def get(self, normalized_text: str) -> dict | None:
+        key = self.build_key(normalized_text)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+
+        result = self.disk.get(key) if self.disk else None
+        with self._lock:
+            if result is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, result)
+        return result
+
+    def set(self, normalized_text: str, result: dict) -> None:
+        key = self.build_key(normalized_text)
+        with self._lock:
+            self._remember(key, result)
+        if self.disk:
+            self.disk.set(key, result)
+
+    def _remember(self, key: str, result: dict) -> None:
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "version": self.version,
+        }
+
+
+analysis_result_cache = ResultCache(
+    RESULT_CACHE_MAX_ENTRIES,
+    disk=DiskCache(
+        RESULT_CACHE_PATH,
+        table="analysis_results",
+        max_entries=RESULT_CACHE_DISK_MAX_ENTRIES,
+        ttl_seconds=RESULT_CACHE_DISK_TTL_SECONDS,
+    )
+    if RESULT_CACHE_DISK
+    else None,
+)
@@ -0,0 +1,67 @@
+import time
+import asyncio
+from dataclasses import dataclass, field
+from collections.abc import Awaitable, Callable
+
+# A stage receives an `emit(kind, payload)` callback for partial results,
+# plus the results of its dependencies as keyword arguments.
+StageFn = Callable[..., Awaitable]
+
+
+@dataclass
+class Stage:
+    name: str
+    run: StageFn
+    deps: tuple[str, ...] = field(default_factory=tuple)
+
+
+def elapsed_ms(started_at: float) -> int:
+    return round((time.perf_counter() - started_at) * 1000)
+
+
+async def run_stage_graph(stages: list[Stage]):
+    """
+    Run stages as a dependency graph: every stage starts as soon as its
+    dependencies finish, so independent chains overlap.
+
+    Yields, in arrival order:
+      ("event", kind, payload)        partial results a stage emitted
+      ("stage", name, result, ms)     a stage finished after `ms` of its own work
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    tasks: dict[str, asyncio.Task] = {}
+    finished = object()
+
+    def emit(kind: str, payload) -> None:
+        queue.put_nowait(("event", kind, payload))
+
+    async def run(stage: Stage):
+        try:
+            inputs = {dep: await tasks[dep] for dep in stage.deps}
+            started_at = time.perf_counter()
+            result = await stage.run(emit, **inputs)
+            queue.put_nowait(("stage", stage.name, result, elapsed_ms(started_at)))
+            return result
+        finally:
+            queue.put_nowait(finished)
+
+    for stage in stages:
+        unknown = [dep for dep in stage.deps if dep not in tasks]
+        if unknown:
+            raise ValueError(f"Stage {stage.name!r} depends on undeclared stages {unknown}")
+        tasks[stage.name] = asyncio.create_task(run(stage))
+
+    remaining = len(tasks)
+    try:
+        while remaining:
+            item = await queue.get()
+            if item is finished:
+                remaining -= 1
+                continue
+            yield item
+
+        for task in tasks.values():
+            task.result()  # surface any stage failure
+    finally:
+        for task in tasks.values():
+            task.cancel()
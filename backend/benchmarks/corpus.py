@@ -0,0 +1,57 @@
+import os
+import glob
+import json
+
+# Fixed benchmark corpus: transcripts already committed under transcripts/youtube,
+# so results stay comparable across machines and commits.
+CORPUS_VIDEO_IDS = ["CDlfiP3L3H4", "frztAv2VZQY", "DhF2ol__Yg0", "Kt_TE9zgPO8"]
+
+BENCHMARKS_DIR = os.path.dirname(__file__)
+TRANSCRIPTS_DIR = os.path.join(os.path.dirname(BENCHMARKS_DIR), "transcripts", "youtube")
+KOMORAN_RECORDING_PATH = os.path.join(BENCHMARKS_DIR, "komoran_recorded.json")
+
+
+def load_chunks() -> list[dict]:
+    chunks = []
+    for video_id in CORPUS_VIDEO_IDS:
+        path = os.path.join(TRANSCRIPTS_DIR, "parsed", f"{video_id}.json")
+        with open(path, encoding="utf-8") as f:
+            chunks.extend(json.load(f))
+    return chunks
+
+
+def load_sentences() -> list[str]:
+    return [chunk["text"] for chunk in load_chunks()]
+
+
+def load_vtt_paths() -> list[str]:
+    paths = []
+    for video_id in CORPUS_VIDEO_IDS:
+        # yt-dlp names files "<title> [<video id>].ko.vtt"; [[] and []] match literal brackets
+        pattern = os.path.join(TRANSCRIPTS_DIR, "raw", f"*[[]{video_id}[]].ko.vtt")
+        paths.extend(sorted(glob.glob(pattern)))
+    return paths
+
+
+def record_komoran_output(sentences: list[str], path: str = KOMORAN_RECORDING_PATH) -> None:
+    """Tag every sentence with the real Komoran (needs the JVM) and save the output."""
+    from backend.language_analysis.linguistic_processing.filtering import get_komoran
+
+    komoran = get_komoran()
+    recorded = {sentence: komoran.pos(sentence) for sentence in sentences}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(recorded, f, ensure_ascii=False)
+
+
+def load_komoran_output(
+    sentences: list[str], path: str = KOMORAN_RECORDING_PATH
+) -> list[list[tuple[str, str]]] | None:
+    """Recorded Komoran tags for the corpus, or None if the recording is missing or stale."""
+    if not os.path.exists(path):
+        return None
+
+    with open(path, encoding="utf-8") as f:
+        recorded = json.load(f)
+    if any(sentence not in recorded for sentence in sentences):
+        return None
+    return [[tuple(token) for token in recorded[sentence]] for sentence in sentences]
@@ -0,0 +1,212 @@
+import sys
+import json
+import math
+import time
+import random
+import asyncio
+import argparse
+import itertools
+
+import httpx
+
+from backend.benchmarks.corpus import load_chunks
+
+### === Load generator for a running KoEx API ===
+#
+# Start the app against local stand-ins so no OpenAI quota is spent:
+#   OPENAI_BACKEND=fake QDRANT_IN_MEMORY=1 uvicorn backend.main:app
+# then:
+#   python -m backend.benchmarks.load_test --concurrency 32 --requests 2000
+#
+# /transcript runs yt-dlp against YouTube and rewrites the parsed transcript, and the
+# committed ones are the benchmark corpus. It is left out of the default mix; to include
+# it, start the server with TRANSCRIPTS_DIR outside the repo and pass --allow-transcript:
+#   TRANSCRIPTS_DIR=/tmp/koex-transcripts OPENAI_BACKEND=fake ... uvicorn backend.main:app
+#   python -m backend.benchmarks.load_test --mix analyze=6,search=3,transcript=1 --allow-transcript
+
+DEFAULT_MIX = "analyze=7,search=3"
+
+
+def parse_mix(spec: str) -> dict[str, int]:
+    mix = {}
+    for part in spec.split(","):
+        name, weight = part.split("=")
+        mix[name.strip()] = int(weight)
+    return mix
+
+
+def percentile(sorted_values: list[float], p: float) -> float | None:
+    """Nearest-rank percentile."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def to_ms(seconds: float | None) -> float | None:
+    return round(seconds * 1000, 1) if seconds is not None else None
+
+
+async def hit_analyze(client: httpx.AsyncClient, chunk: dict, suffix: str) -> float | None:
+    """Streams /analyze-stream until the result event; returns time to first byte."""
+    first_byte = None
+    started_at = time.perf_counter()
+    params = {"input": chunk["text"] + suffix}
+
+    async with client.stream("GET", "/analyze-stream", params=params) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if first_byte is None:
+                first_byte = time.perf_counter() - started_at
+            if line == "event: result":
+                return first_byte
+    raise RuntimeError("stream ended without a result event")
+
+
+async def hit_search(client: httpx.AsyncClient, chunk: dict, suffix: str) -> None:
+    params = {
+        "query": chunk["text"] + suffix,
+        "videoId": chunk["videoId"],
+        "start": chunk["start"],
+    }
+    response = await client.get("/search", params=params)
+    response.raise_for_status()
+    # /search reports embedding / Qdrant failures in a 200 body
+    body = response.json()
+    if isinstance(body, dict) and "error" in body:
+        raise RuntimeError(body["error"])
+
+
+async def hit_transcript(client: httpx.AsyncClient, chunk: dict, suffix: str) -> None:
+    params = {"videoUrl": f"https://www.youtube.com/watch?v={chunk['videoId']}"}
+    response = await client.get("/transcript", params=params)
+    response.raise_for_status()
+
+
+ENDPOINTS = {
+    "analyze": hit_analyze,
+    "search": hit_search,
+    "transcript": hit_transcript,
+}
+
+
+async def run_load(args) -> dict:
+    mix = parse_mix(args.mix)
+    unknown = set(mix) - set(ENDPOINTS)
+    if unknown:
+        raise SystemExit(f"Unknown endpoints in --mix: {sorted(unknown)}")
+    if mix.get("transcript") and not args.allow_transcript:
+        raise SystemExit(
+            "/transcript rewrites the server's parsed transcripts; start it with TRANSCRIPTS_DIR "
+            "outside the repo and pass --allow-transcript"
+        )
+
+    names = [name for name, weight in mix.items() if weight > 0]
+    weights = [mix[name] for name in names]
+    chunks = load_chunks()
+    rng = random.Random(args.seed)
+
+    latencies = {name: [] for name in names}
+    first_bytes: list[float] = []
+    errors = {name: 0 for name in names}
+    counter = itertools.count()
+    deadline = time.perf_counter() + args.duration if args.duration else None
+
+    async def worker(client: httpx.AsyncClient):
+        while True:
+            n = next(counter)
+            if n >= args.requests and deadline is None:
+                return
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+
+            name = rng.choices(names, weights)[0]
+            chunk = chunks[n % len(chunks)]
+            # a unique suffix defeats the result / LLM caches when measuring cold paths
+            suffix = f" {n}" if args.cache_busting else ""
+
+            started_at = time.perf_counter()
+            try:
+                first_byte = await ENDPOINTS[name](client, chunk, suffix)
+            except Exception as e:
+                errors[name] += 1
+                if args.verbose:
+                    print(f"⚠️ {name} failed: {e}")
+                continue
+            latencies[name].append(time.perf_counter() - started_at)
+            if first_byte is not None:
+                first_bytes.append(first_byte)
+
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=args.base_url, timeout=args.timeout, limits=limits
+    ) as client:
+        started_at = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(args.concurrency)))
+        wall_time = time.perf_counter() - started_at
+
+    report = {"concurrency": args.concurrency, "wall_time_s": wall_time, "endpoints": {}}
+    for name in names:
+        values = sorted(latencies[name])
+        report["endpoints"][name] = {
+            "completed": len(values),
+            "errors": errors[name],
+            "throughput_rps": len(values) / wall_time,
+            **{f"p{p}_ms": to_ms(percentile(values, p)) for p in (50, 95, 99)},
+        }
+    if first_bytes:
+        values = sorted(first_bytes)
+        report["endpoints"]["analyze"].update(
+            {f"first_byte_p{p}_ms": to_ms(percentile(values, p)) for p in (50, 95, 99)}
+        )
+
+    total = sum(len(values) for values in latencies.values())
+    report["throughput_rps"] = total / wall_time
+    return report
+
+
+### === MAIN ===
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--requests", type=int, default=500, help="total requests (ignored with --duration)"
+    )
+    parser.add_argument("--duration", type=float, help="run for this many seconds instead")
+    parser.add_argument(
+        "--mix", default=DEFAULT_MIX, help="endpoint weights, e.g. analyze=7,search=3"
+    )
+    parser.add_argument(
+        "--allow-transcript",
+        action="store_true",
+        help="allow transcript in --mix (server must run with TRANSCRIPTS_DIR outside the repo)",
+    )
+    parser.add_argument("--cache-busting", action="store_true", help="make every input unique")
+    parser.add_argument("--timeout", type=float, default=120)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the report JSON here")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_load(args))
+
+    print(
+        f"\n{report['throughput_rps']:.1f} req/s over {report['wall_time_s']:.1f}s"
+        f" at concurrency {args.concurrency}"
+    )
+    for name, stats in report["endpoints"].items():
+        print(
+            f"  {name:<11} {stats['completed']:>6} ok {stats['errors']:>5} err"
+            f"  p50 {stats['p50_ms']} ms  p95 {stats['p95_ms']} ms  p99 {stats['p99_ms']} ms"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"📁 Saved report to {args.output}")
+
+    # a run where nothing succeeded usually means the server isn't up
+    if not any(stats["completed"] for stats in report["endpoints"].values()):
+        sys.exit(1)
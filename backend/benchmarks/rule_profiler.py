@@ -0,0 +1,185 @@
+import sys
+import json
+import time
+import argparse
+from collections import Counter
+
+from backend.benchmarks.corpus import load_komoran_output, load_sentences
+from backend.language_analysis.linguistic_processing.grouping import (
+    GROUPING_RULES,
+    PARTICLE_TAGS,
+    apply_grouping_rules,
+)
+from backend.language_analysis.linguistic_processing.rule_matcher import (
+    GRAMMAR_RULES,
+    match_rule,
+    merge_aux_grammar_chunks,
+)
+
+### === Grammar rule profiler ===
+#
+#   python -m backend.benchmarks.rule_profiler                      # recorded corpus output
+#   python -m backend.benchmarks.rule_profiler --live               # tag the corpus now (needs the JVM)
+#   python -m backend.benchmarks.rule_profiler --input tagged.json  # [[[token, tag], ...], ...]
+#
+# Replays the merge and grouping passes outside the hot path, evaluating every rule at
+# every position the real pass visits. A hit is a rule that matched there; a win is the
+# rule the real pass applied. Rules that hit but never win are shadowed by longer
+# (grammar) or earlier (grouping) rules.
+
+
+def new_rule_stats(name: str) -> dict:
+    return {"name": name, "attempts": 0, "hits": 0, "wins": 0, "time_s": 0.0, "shadowed_by": Counter()}
+
+
+def profile_grammar_rules(tagged: list[tuple[str, str]], stats: list[dict]) -> None:
+    i = 0
+    while i < len(tagged):
+        hits = []
+        for index, rule in enumerate(GRAMMAR_RULES):
+            started_at = time.perf_counter()
+            result = match_rule(tagged, i, rule)
+            stats[index]["time_s"] += time.perf_counter() - started_at
+            stats[index]["attempts"] += 1
+            if result:
+                stats[index]["hits"] += 1
+                hits.append(index)
+
+        if not hits:
+            i += 1
+            continue
+
+        # same choice as find_best_rule_match: longest pattern, then earliest rule
+        winner = min(hits, key=lambda index: (-len(GRAMMAR_RULES[index]["pattern"]), index))
+        stats[winner]["wins"] += 1
+        for index in hits:
+            if index != winner:
+                stats[index]["shadowed_by"][GRAMMAR_RULES[winner]["name"]] += 1
+        i += len(GRAMMAR_RULES[winner]["pattern"])
+
+
+def profile_grouping_rules(merged: list[tuple[str, str]], stats: list[dict]) -> None:
+    grouped: list[tuple[str, str]] = []
+    i = 0
+    while i < len(merged):
+        tag = merged[i][1]
+        # positions apply_grouping_rules settles before trying any rule
+        if not tag.startswith(("aux_", "verb_")) and tag not in PARTICLE_TAGS:
+            winner = None
+            for index, matcher in enumerate(GROUPING_RULES):
+                started_at = time.perf_counter()
+                match = matcher(merged, i)
+                stats[index]["time_s"] += time.perf_counter() - started_at
+                stats[index]["attempts"] += 1
+                if not match:
+                    continue
+                stats[index]["hits"] += 1
+                if winner is None:
+                    winner = index
+                    stats[index]["wins"] += 1
+                else:
+                    stats[index]["shadowed_by"][GROUPING_RULES[winner].__name__] += 1
+
+        grouped, i = apply_grouping_rules(grouped, merged, i)
+
+
+def finalize(stats: list[dict]) -> list[dict]:
+    return [
+        {
+            "name": rule["name"],
+            "attempts": rule["attempts"],
+            "hits": rule["hits"],
+            "wins": rule["wins"],
+            "time_ms": rule["time_s"] * 1000,
+            "shadowed_by": dict(rule["shadowed_by"]),
+        }
+        for rule in stats
+    ]
+
+
+def profile_rules(tagged_sentences: list[list[tuple[str, str]]]) -> dict:
+    """
+    Per-rule attempts, hits, wins and time for the auxiliary grammar rules and the
+    grouping rules over Komoran-tagged sentences, plus rules that never match and
+    rules that match but are always beaten by another.
+    """
+    grammar_stats = [new_rule_stats(rule["name"]) for rule in GRAMMAR_RULES]
+    grouping_stats = [new_rule_stats(matcher.__name__) for matcher in GROUPING_RULES]
+    merge_s = 0.0
+
+    for tagged in tagged_sentences:
+        tagged = [tuple(token) for token in tagged]
+        profile_grammar_rules(tagged, grammar_stats)
+
+        started_at = time.perf_counter()
+        merged = merge_aux_grammar_chunks(tagged)
+        merge_s += time.perf_counter() - started_at
+        profile_grouping_rules(merged, grouping_stats)
+
+    report = {
+        "sentences": len(tagged_sentences),
+        # the real (compiled) merge pass, for scale against the per-rule times
+        "merge_ms": merge_s * 1000,
+        "grammar_rules": finalize(grammar_stats),
+        "grouping_rules": finalize(grouping_stats),
+    }
+    all_rules = report["grammar_rules"] + report["grouping_rules"]
+    report["never_matched"] = [rule["name"] for rule in all_rules if not rule["hits"]]
+    report["shadowed"] = [rule["name"] for rule in all_rules if rule["hits"] and not rule["wins"]]
+    return report
+
+
+def load_tagged_sentences(path: str) -> list[list[tuple[str, str]]]:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    # a --record style {sentence: tags} file works too
+    if isinstance(data, dict):
+        data = list(data.values())
+    return [[tuple(token) for token in tagged] for tagged in data]
+
+
+def print_rule_table(title: str, rules: list[dict], sort_by: str) -> None:
+    print(f"\n{title}")
+    print(f"  {'rule':<30} {'attempts':>9} {'hits':>7} {'wins':>7} {'time ms':>9}  shadowed by")
+    for rule in sorted(rules, key=lambda rule: rule[sort_by], reverse=True):
+        shadowed_by = ", ".join(f"{name}×{n}" for name, n in rule["shadowed_by"].items())
+        print(
+            f"  {rule['name']:<30} {rule['attempts']:>9} {rule['hits']:>7} {rule['wins']:>7}"
+            f" {rule['time_ms']:>9.2f}  {shadowed_by}"
+        )
+
+
+### === MAIN ===
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--input", help="JSON of tagged sentences instead of the benchmark corpus")
+    parser.add_argument("--live", action="store_true", help="tag the corpus with Komoran now (needs the JVM)")
+    parser.add_argument("--sort", choices=["time_ms", "hits", "wins", "attempts"], default="time_ms")
+    parser.add_argument("--output", help="write the report JSON here")
+    args = parser.parse_args()
+
+    if args.input:
+        tagged_sentences = load_tagged_sentences(args.input)
+    elif args.live:
+        from backend.language_analysis.linguistic_processing.filtering import tokenize_many
+
+        tagged_sentences = tokenize_many(load_sentences())
+    else:
+        tagged_sentences = load_komoran_output(load_sentences())
+        if tagged_sentences is None:
+            print("⚠️ No Komoran recording for the corpus; run run_benchmarks --record, or use --live / --input")
+            sys.exit(1)
+
+    report = profile_rules(tagged_sentences)
+
+    print(f"Profiled {report['sentences']} sentences (compiled merge pass: {report['merge_ms']:.2f} ms)")
+    print_rule_table("Auxiliary grammar rules", report["grammar_rules"], args.sort)
+    print_rule_table("Grouping rules", report["grouping_rules"], args.sort)
+    print(f"\nNever matched: {', '.join(report['never_matched']) or '-'}")
+    print(f"Shadowed (match but never applied): {', '.join(report['shadowed']) or '-'}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"📁 Saved report to {args.output}")
@@ -0,0 +1,241 @@
+import gc
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import tracemalloc
+
+from backend.benchmarks.corpus import (
+    KOMORAN_RECORDING_PATH,
+    load_komoran_output,
+    load_sentences,
+    load_vtt_paths,
+    record_komoran_output,
+)
+from backend.language_analysis.linguistic_processing.filtering import (
+    filter_allowed_tokens,
+    get_komoran,
+)
+from backend.language_analysis.linguistic_processing.grouping import group_komoran_tokens
+from backend.language_analysis.linguistic_processing.komoran_pool import bulk_pos
+from backend.language_analysis.linguistic_processing.rule_matcher import (
+    merge_aux_grammar_chunks,
+)
+from backend.language_analysis.romanizer import romanize
+from backend.language_analysis.word_extraction import (
+    extract_candidate_korean_words,
+    tag_if_derived_by_substring,
+)
+from backend.transcripts.vtt_parser import (
+    chunk_by_sentences,
+    parse_vtt_file,
+    read_vtt_segments,
+)
+
+### === Benchmarks for the local (non-GPT) linguistic pipeline ===
+#
+#   python -m backend.benchmarks.run_benchmarks --output results.json
+#   python -m backend.benchmarks.run_benchmarks --baseline results.json   # exits 1 on regression
+#   python -m backend.benchmarks.run_benchmarks --record                  # needs the JVM
+#   python -m backend.benchmarks.run_benchmarks --live                    # needs the JVM
+#
+# Each benchmark processes the whole corpus once per round. Time is the median
+# round; memory is the tracemalloc peak of one extra, separately traced round.
+
+
+def build_benchmarks(komoran_output, live: bool = False) -> dict:
+    """name -> (item count, zero-arg function processing every item once)"""
+    sentences = load_sentences()
+    vtt_paths = load_vtt_paths()
+    segments_per_file = [read_vtt_segments(path) for path in vtt_paths]
+
+    benchmarks = {
+        "romanize": (len(sentences), lambda: [romanize(s) for s in sentences]),
+        "parse_vtt_file": (len(vtt_paths), lambda: [parse_vtt_file(p) for p in vtt_paths]),
+        "chunk_by_sentences": (
+            sum(len(segments) for segments in segments_per_file),
+            lambda: [chunk_by_sentences(segments) for segments in segments_per_file],
+        ),
+    }
+    if live:
+        # per-sentence `pos` vs `bulk_pos` plain-text readback: the gap is the per-token
+        # JVM crossing overhead (not tokenize_many, whose cache would serve the reruns)
+        komoran = get_komoran()
+        benchmarks.update(
+            {
+                "komoran_pos": (len(sentences), lambda: [komoran.pos(s) for s in sentences]),
+                "komoran_bulk_pos": (len(sentences), lambda: bulk_pos(komoran, sentences)),
+            }
+        )
+    if komoran_output is None:
+        return benchmarks
+
+    # each stage is fed the real output of the stage before it
+    merged = [merge_aux_grammar_chunks(tokens) for tokens in komoran_output]
+    grouped = [group_komoran_tokens(tokens) for tokens in merged]
+    filtered = [filter_allowed_tokens(tokens, {}) for tokens in grouped]
+    candidates = [extract_candidate_korean_words(tokens) for tokens in filtered]
+
+    benchmarks.update(
+        {
+            "merge_aux_grammar_chunks": (
+                len(komoran_output),
+                lambda: [merge_aux_grammar_chunks(tokens) for tokens in komoran_output],
+            ),
+            "group_komoran_tokens": (
+                len(merged),
+                lambda: [group_komoran_tokens(tokens) for tokens in merged],
+            ),
+            "filter_allowed_tokens": (
+                len(grouped),
+                lambda: [filter_allowed_tokens(tokens, {}) for tokens in grouped],
+            ),
+            "tag_if_derived_by_substring": (
+                len(candidates),
+                lambda: [tag_if_derived_by_substring(words) for words in candidates],
+            ),
+        }
+    )
+    return benchmarks
+
+
+def measure(fn, items: int, rounds: int, warmup: int) -> dict:
+    for _ in range(warmup):
+        fn()
+
+    durations = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            started_at = time.perf_counter()
+            fn()
+            durations.append(time.perf_counter() - started_at)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = fn()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+
+    median = statistics.median(durations)
+    return {
+        "items": items,
+        "rounds": rounds,
+        "median_s": median,
+        "min_s": min(durations),
+        "items_per_s": items / median if median else None,
+        "peak_bytes": peak - before,
+        "retained_bytes": after - before,
+    }
+
+
+def compare_to_baseline(
+    results: dict, baseline: dict, time_threshold: float, memory_threshold: float
+) -> list[str]:
+    regressions = []
+    for name, current in results["benchmarks"].items():
+        previous = baseline.get("benchmarks", {}).get(name)
+        if previous is None:
+            continue
+
+        time_ratio = current["median_s"] / previous["median_s"]
+        memory_ratio = current["peak_bytes"] / max(previous["peak_bytes"], 1)
+        status = "ok"
+        if time_ratio > 1 + time_threshold:
+            status = "SLOWER"
+            regressions.append(f"{name}: {time_ratio:.2f}x median time")
+        if memory_ratio > 1 + memory_threshold:
+            status = "MORE MEMORY" if status == "ok" else f"{status} + MORE MEMORY"
+            regressions.append(f"{name}: {memory_ratio:.2f}x peak memory")
+        print(f"  {name:<30} time {time_ratio:5.2f}x  memory {memory_ratio:5.2f}x  {status}")
+    return regressions
+
+
+### === MAIN ===
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--record", action="store_true", help="re-record Komoran output (needs the JVM), then exit"
+    )
+    parser.add_argument(
+        "--live", action="store_true", help="also time live Komoran tagging (needs the JVM)"
+    )
+    parser.add_argument("--rounds", type=int, default=7)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--only", nargs="*", help="benchmark names to run")
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument(
+        "--time-threshold", type=float, default=0.20, help="allowed median slowdown (0.20 = 20%%)"
+    )
+    parser.add_argument(
+        "--memory-threshold", type=float, default=0.20, help="allowed peak memory growth"
+    )
+    args = parser.parse_args()
+
+    if args.record:
+        sentences = load_sentences()
+        record_komoran_output(sentences)
+        print(f"📁 Recorded Komoran output for {len(sentences)} sentences to {KOMORAN_RECORDING_PATH}")
+        sys.exit(0)
+
+    komoran_output = load_komoran_output(load_sentences())
+    if komoran_output is None:
+        print("⚠️ No Komoran recording for this corpus; run with --record to include the token benchmarks")
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "komoran_recorded": komoran_output is not None,
+            "timestamp": time.time(),
+        },
+        "benchmarks": {},
+    }
+
+    for name, (items, fn) in build_benchmarks(komoran_output, args.live).items():
+        if args.only and name not in args.only:
+            continue
+        result = measure(fn, items, args.rounds, args.warmup)
+        results["benchmarks"][name] = result
+        print(
+            f"  {name:<30} {result['items_per_s']:>12,.0f} items/s"
+            f"  median {result['median_s'] * 1000:8.2f} ms"
+            f"  peak {result['peak_bytes'] / 1024:9.1f} KiB"
+        )
+
+    per_text, bulk = (results["benchmarks"].get(n) for n in ("komoran_pos", "komoran_bulk_pos"))
+    if per_text and bulk:
+        saved = (per_text["median_s"] - bulk["median_s"]) / per_text["items"]
+        print(f"  bulk_pos saves {saved * 1e6:.1f} µs per sentence over per-sentence pos")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"📁 Saved results to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"\nCompared to {args.baseline}:")
+        regressions = compare_to_baseline(
+            results, baseline, args.time_threshold, args.memory_threshold
+        )
+        if regressions:
+            print("\n❌ Performance regressions:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+        print("\n✅ No regressions")
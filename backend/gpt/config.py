@@ -1 +1,46 @@
-BATCH_SIZE = 20
\ No newline at end of file
+import os
+
+BATCH_SIZE = 20
+
+# Shared HTTP connection pool for the async OpenAI client
+OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "30"))
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "100"))
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "20"))
+
+# Disk-backed cache of chat completions keyed on (model, temperature, prompts)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "1") == "1"
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "llm_cache.sqlite3")
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "50000"))
+LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+
+# Persistent per-word Hanja / definition entries, so only unseen words go to GPT
+WORD_STORE_ENABLED = os.getenv("WORD_STORE_ENABLED", "1") == "1"
+WORD_STORE_PATH = os.getenv("WORD_STORE_PATH", "word_store.sqlite3")
+WORD_STORE_MAX_ENTRIES = int(os.getenv("WORD_STORE_MAX_ENTRIES", "200000"))
+
+# Starting budgets for the process-wide rate limiter; corrected from x-ratelimit-* headers
+OPENAI_REQUESTS_PER_MINUTE = float(os.getenv("OPENAI_REQUESTS_PER_MINUTE", "500"))
+OPENAI_TOKENS_PER_MINUTE = float(os.getenv("OPENAI_TOKENS_PER_MINUTE", "30000"))
+
+# Max GPT batches one request keeps in flight at once
+GPT_CONCURRENCY = int(os.getenv("GPT_CONCURRENCY", "4"))
+
+# Spacing normalization + idiom detection in a single structured GPT call
+FUSED_PREPROCESSING = os.getenv("FUSED_PREPROCESSING", "1") == "1"
+
+# One GPT pass returns Hanja + definitions per word instead of two separate prompts
+UNIFIED_ENRICHMENT = os.getenv("UNIFIED_ENRICHMENT", "1") == "1"
+
+# Window for merging concurrent requests' words into one GPT batch (0 disables)
+MICRO_BATCH_WINDOW_MS = float(os.getenv("MICRO_BATCH_WINDOW_MS", "25"))
+
+# "fake" swaps OpenAI for a local stand-in (gpt/fake_openai.py) for load testing
+OPENAI_BACKEND = os.getenv("OPENAI_BACKEND", "openai")
+# latency specs: fixed:MS | uniform:LO_MS:HI_MS | normal:MEAN_MS:SD_MS | lognormal:MEDIAN_MS:SIGMA
+FAKE_OPENAI_CHAT_LATENCY = os.getenv("FAKE_OPENAI_CHAT_LATENCY", "lognormal:400:0.5")
+FAKE_OPENAI_EMBEDDING_LATENCY = os.getenv("FAKE_OPENAI_EMBEDDING_LATENCY", "lognormal:80:0.3")
+FAKE_OPENAI_ERROR_RATE = float(os.getenv("FAKE_OPENAI_ERROR_RATE", "0"))
+FAKE_OPENAI_RATE_LIMIT_RATE = float(os.getenv("FAKE_OPENAI_RATE_LIMIT_RATE", "0"))
+FAKE_OPENAI_SEED = int(os.getenv("FAKE_OPENAI_SEED", "0"))
+# optional JSON file of canned chat answers: {sha256(prompt): content}
+FAKE_OPENAI_CANNED_PATH = os.getenv("FAKE_OPENAI_CANNED_PATH", "")
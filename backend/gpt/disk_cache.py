@@ -0,0 +1,142 @@
+import json
+import sqlite3
+import threading
+import time
+
+
+class DiskCache:
+    """
+    SQLite-backed key/value cache with LRU eviction, TTL expiry and hit/miss counters.
+    Values are stored as JSON, so anything `json.dumps` accepts can be cached.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        table: str = "cache",
+        max_entries: int = 10_000,
+        ttl_seconds: float | None = None,
+    ):
+        self.path = path
+        self.table = table
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.table}_accessed_at "
+                f"ON {self.table} (accessed_at)"
+            )
+        return self._conn
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def get(self, key: str):
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: list[str]) -> dict:
+        """Return cached values for the keys that hit; missing or expired keys are absent."""
+        if not keys:
+            return {}
+
+        now = time.time()
+        found = {}
+        expired = []
+
+        with self._lock:
+            conn = self._connect()
+            placeholders = ",".join("?" * len(keys))
+            rows = conn.execute(
+                f"SELECT key, value, created_at FROM {self.table} WHERE key IN ({placeholders})",
+                keys,
+            ).fetchall()
+
+            for key, value, created_at in rows:
+                if self._is_expired(created_at, now):
+                    expired.append(key)
+                else:
+                    found[key] = json.loads(value)
+
+            if expired:
+                conn.executemany(
+                    f"DELETE FROM {self.table} WHERE key = ?", [(k,) for k in expired]
+                )
+            if found:
+                conn.executemany(
+                    f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?",
+                    [(now, k) for k in found],
+                )
+            conn.commit()
+
+            self.hits += len(found)
+            self.misses += len(set(keys)) - len(found)
+
+        return found
+
+    def set(self, key: str, value) -> None:
+        self.set_many({key: value})
+
+    def set_many(self, items: dict) -> None:
+        if not items:
+            return
+
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (key, json.dumps(value, ensure_ascii=False), now, now)
+                    for key, value in items.items()
+                ],
+            )
+            self._evict(conn)
+            conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        (count,) = conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            conn.execute(
+                f"DELETE FROM {self.table} WHERE key IN ("
+                f"SELECT key FROM {self.table} ORDER BY accessed_at ASC LIMIT ?)",
+                (overflow,),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute(f"DELETE FROM {self.table}")
+            conn.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            (size,) = self._connect().execute(
+                f"SELECT COUNT(*) FROM {self.table}"
+            ).fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": size,
+            "max_entries": self.max_entries,
+        }
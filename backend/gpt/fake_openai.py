@@ -0,0 +1,241 @@
+import re
+import json
+import time
+import random
+import asyncio
+import hashlib
+from types import SimpleNamespace
+
+import httpx
+from openai import InternalServerError, RateLimitError
+
+from backend.gpt.config import (
+    FAKE_OPENAI_CANNED_PATH,
+    FAKE_OPENAI_CHAT_LATENCY,
+    FAKE_OPENAI_EMBEDDING_LATENCY,
+    FAKE_OPENAI_ERROR_RATE,
+    FAKE_OPENAI_RATE_LIMIT_RATE,
+    FAKE_OPENAI_SEED,
+)
+from backend.vector.constants import VECTOR_DIM
+
+# -----------------------------------------------------------------------------
+# Local stand-in for the OpenAI SDK surface OpenAIClient uses (OPENAI_BACKEND=fake).
+# Responses are derived from the prompt alone, so the same input always gets the
+# same answer; latency and failures are drawn from the configured distributions.
+# -----------------------------------------------------------------------------
+
+FAKE_POS = ["noun", "verb", "adjective", "adverb"]
+STREAM_CHUNK_CHARS = 16
+
+rng = random.Random(FAKE_OPENAI_SEED)
+
+
+def parse_latency_spec(spec: str):
+    """Returns a zero-arg sampler of seconds for a `kind:params` spec (see config.py)."""
+    kind, *params = spec.split(":")
+    values = [float(p) for p in params]
+
+    if kind == "fixed":
+        return lambda: values[0] / 1000
+    if kind == "uniform":
+        return lambda: rng.uniform(values[0], values[1]) / 1000
+    if kind == "normal":
+        return lambda: max(0.0, rng.gauss(values[0], values[1])) / 1000
+    if kind == "lognormal":
+        return lambda: values[0] * rng.lognormvariate(0, values[1]) / 1000
+    raise ValueError(f"Unknown latency distribution: {spec!r}")
+
+
+chat_latency = parse_latency_spec(FAKE_OPENAI_CHAT_LATENCY)
+embedding_latency = parse_latency_spec(FAKE_OPENAI_EMBEDDING_LATENCY)
+
+
+def stable_int(text: str) -> int:
+    return int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big")
+
+
+def load_canned_responses(path: str) -> dict[str, str]:
+    if not path:
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+canned_responses = load_canned_responses(FAKE_OPENAI_CANNED_PATH)
+
+
+def prompt_field(prompt: str, name: str) -> str:
+    match = re.search(rf"^{name}: (.*)$", prompt, re.MULTILINE)
+    return match.group(1).strip() if match else ""
+
+
+def fake_definition(word: str) -> dict:
+    return {
+        "word": word,
+        "pos": FAKE_POS[stable_int(word) % len(FAKE_POS)],
+        "definition": f"definition of {word}",
+        "example": f"{word} 예문입니다.",
+    }
+
+
+def fake_hanja(word: str) -> dict:
+    return {"korean": word, "hanja": "", "characters": []}
+
+
+def fake_gloss(sentence: str) -> str:
+    return f"Gloss #{stable_int(sentence) % 10_000} ({len(sentence.split())} words)."
+
+
+def fake_chat_content(prompt: str) -> str:
+    """Answer in the shape each KoEx prompt asks for, keyed on its opening line."""
+    canned = canned_responses.get(hashlib.sha256(prompt.encode("utf-8")).hexdigest())
+    if canned is not None:
+        return canned
+
+    opening = prompt.strip().splitlines()[0] if prompt.strip() else ""
+
+    if opening.startswith("For each Korean sentence, add natural Korean spacing"):
+        texts = json.loads(prompt_field(prompt, "Sentences") or "[]")
+        return json.dumps([{"text": text, "idioms": []} for text in texts], ensure_ascii=False)
+    if opening.startswith("Add natural Korean spacing only, then detect"):
+        return json.dumps({"text": prompt_field(prompt, "Text"), "idioms": []}, ensure_ascii=False)
+    if opening.startswith("Add natural Korean spacing only"):
+        return prompt_field(prompt, "Text")
+    if opening.startswith("Detect Korean idioms"):
+        return "[]"
+    if opening.startswith("Translate each Korean sentence"):
+        texts = json.loads(prompt_field(prompt, "Sentences") or "[]")
+        return json.dumps([fake_gloss(text) for text in texts])
+    if opening.startswith("Translate this Korean sentence"):
+        return fake_gloss(prompt_field(prompt, "Sentence"))
+
+    words = json.loads(prompt_field(prompt, "Items") or "[]")
+    if opening.startswith("Return Hanja data"):
+        return json.dumps([fake_hanja(word) for word in words], ensure_ascii=False)
+    if "korean, hanja, characters, pos, definition, example" in prompt:
+        entries = []
+        for word in words:
+            definition = fake_definition(word)
+            del definition["word"]
+            entries.append({**fake_hanja(word), **definition})
+        return json.dumps(entries, ensure_ascii=False)
+    if words:
+        return json.dumps([fake_definition(word) for word in words], ensure_ascii=False)
+    return "OK"
+
+
+def fake_embedding(text: str) -> list[float]:
+    vector_rng = random.Random(stable_int(text))
+    vector = [vector_rng.gauss(0, 1) for _ in range(VECTOR_DIM)]
+    norm = sum(v * v for v in vector) ** 0.5
+    return [v / norm for v in vector]
+
+
+def maybe_fail() -> None:
+    roll = rng.random()
+    request = httpx.Request("POST", "https://fake-openai.local/v1")
+    if roll < FAKE_OPENAI_RATE_LIMIT_RATE:
+        response = httpx.Response(429, request=request, headers={"retry-after-ms": "200"})
+        raise RateLimitError("Fake rate limit", response=response, body=None)
+    if roll < FAKE_OPENAI_RATE_LIMIT_RATE + FAKE_OPENAI_ERROR_RATE:
+        response = httpx.Response(500, request=request)
+        raise InternalServerError("Fake server error", response=response, body=None)
+
+
+def build_usage(prompt: str, content: str) -> SimpleNamespace:
+    prompt_tokens, completion_tokens = len(prompt) // 2, len(content) // 2
+    return SimpleNamespace(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        total_tokens=prompt_tokens + completion_tokens,
+    )
+
+
+def build_completion(prompt: str) -> SimpleNamespace:
+    content = fake_chat_content(prompt)
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        usage=build_usage(prompt, content),
+    )
+
+
+def last_user_prompt(messages: list[dict]) -> str:
+    return messages[-1]["content"] if messages else ""
+
+
+class FakeRawResponse:
+    def __init__(self, completion):
+        self.headers = httpx.Headers()
+        self._completion = completion
+
+    def parse(self):
+        return self._completion
+
+
+class FakeStream:
+    def __init__(self, prompt: str, latency: float):
+        self.response = SimpleNamespace(headers=httpx.Headers())
+        self.prompt = prompt
+        self.latency = latency
+
+    def __aiter__(self):
+        return self._chunks()
+
+    async def _chunks(self):
+        content = fake_chat_content(self.prompt)
+        pieces = [
+            content[i:i + STREAM_CHUNK_CHARS] for i in range(0, len(content), STREAM_CHUNK_CHARS)
+        ]
+        for piece in pieces:
+            await asyncio.sleep(self.latency / max(len(pieces), 1))
+            yield SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))], usage=None
+            )
+        yield SimpleNamespace(choices=[], usage=build_usage(self.prompt, content))
+
+
+class FakeAsyncCompletions:
+    def __init__(self):
+        self.with_raw_response = self
+
+    async def create(self, model, messages, stream=False, **kwargs):
+        latency = chat_latency()
+        prompt = last_user_prompt(messages)
+        if stream:
+            # half the latency before the first token, the rest spread over the stream
+            await asyncio.sleep(latency / 2)
+            maybe_fail()
+            return FakeStream(prompt, latency / 2)
+
+        await asyncio.sleep(latency)
+        maybe_fail()
+        return FakeRawResponse(build_completion(prompt))
+
+
+class FakeCompletions:
+    def create(self, model, messages, **kwargs):
+        time.sleep(chat_latency())
+        maybe_fail()
+        return build_completion(last_user_prompt(messages))
+
+
+class FakeEmbeddings:
+    def create(self, model, input):
+        time.sleep(embedding_latency())
+        maybe_fail()
+        return SimpleNamespace(
+            data=[SimpleNamespace(embedding=fake_embedding(text)) for text in input],
+            usage=SimpleNamespace(prompt_tokens=sum(len(text) // 2 for text in input)),
+        )
+
+
+class FakeAsyncOpenAI:
+    def __init__(self):
+        self.chat = SimpleNamespace(completions=FakeAsyncCompletions())
+
+
+class FakeOpenAI:
+    def __init__(self):
+        self.chat = SimpleNamespace(completions=FakeCompletions())
+        self.embeddings = FakeEmbeddings()
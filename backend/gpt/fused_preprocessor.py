@@ -0,0 +1,120 @@
+import json
+
+from backend.gpt.config import BATCH_SIZE
+from backend.gpt.openai_client import OpenAIClient
+from backend.gpt.utils import gather_with_limit, load_json_response, parse_response
+from backend.metrics import STAGE_LATENCY
+
+client = OpenAIClient()
+
+
+def build_fused_preprocessing_prompt(text: str) -> str:
+    return f"""
+Add natural Korean spacing only, then detect Korean idioms or 사자성어 in the spaced text.
+Do not rewrite words, punctuation, or meaning.
+For each idiom give its start/end character offsets in the spaced text (end exclusive).
+Return only JSON. If no idioms, use "idioms": [].
+
+Text: {text}
+
+Format:
+{{"text":"고진감래라는 말이 있다","idioms":[{{"idiom":"고진감래","start":0,"end":4}}]}}
+"""
+
+
+def resolve_idiom_spans(text: str, idioms: list) -> list[tuple[int, int, str]]:
+    """
+    Verify GPT's offsets against the spaced text, re-locating an idiom when they drift.
+    Returns sorted, non-overlapping (start, end, idiom) spans.
+    """
+    spans: list[tuple[int, int, str]] = []
+
+    for item in idioms:
+        if not isinstance(item, dict) or not item.get("idiom"):
+            continue
+
+        idiom = item["idiom"]
+        start, end = item.get("start"), item.get("end")
+        if not (isinstance(start, int) and start >= 0 and text[start:end] == idiom):
+            start = text.find(idiom)
+            if start == -1:
+                continue
+        spans.append((start, start + len(idiom), idiom))
+
+    resolved: list[tuple[int, int, str]] = []
+    for span in sorted(spans):
+        if not resolved or span[0] >= resolved[-1][1]:
+            resolved.append(span)
+    return resolved
+
+
+def build_fused_preprocessing_batch_prompt(texts: list[str]) -> str:
+    return f"""
+For each Korean sentence, add natural Korean spacing only, then detect Korean idioms or 사자성어 in the spaced text.
+Do not rewrite words, punctuation, or meaning.
+For each idiom give its start/end character offsets in the spaced text (end exclusive).
+Return only a JSON array with one object per sentence, in the same order. If no idioms, use "idioms": [].
+
+Sentences: {json.dumps(texts, ensure_ascii=False)}
+
+Format:
+[
+  {{"text":"고진감래라는 말이 있다","idioms":[{{"idiom":"고진감래","start":0,"end":4}}]}}
+]
+"""
+
+
+def resolve_fused_result(
+    text: str, data
+) -> tuple[str, list[tuple[int, int, str]]] | None:
+    if not isinstance(data, dict) or not isinstance(data.get("text"), str):
+        return None
+
+    spaced_text = data["text"].strip()
+    # spacing must not rewrite the text itself
+    if "".join(spaced_text.split()) != "".join(text.split()):
+        return None
+
+    return spaced_text, resolve_idiom_spans(spaced_text, data.get("idioms") or [])
+
+
+async def normalize_spacing_and_detect_idioms(
+    text: str,
+) -> tuple[str, list[tuple[int, int, str]]] | None:
+    """Returns (spaced_text, idiom_spans), or None if the response was unusable."""
+    with STAGE_LATENCY.time(stage="spacing_idiom_fused"):
+        content = await client.acall(
+            build_fused_preprocessing_prompt(text),
+            prompt_type="fused_preprocessing",
+            validate=lambda content: resolve_fused_result(text, load_json_response(content)) is not None,
+        )
+    data = parse_response(content, "fused_preprocessing") if content else None
+    return resolve_fused_result(text, data)
+
+
+def resolve_fused_batch(batch: list[str], data) -> list:
+    if not isinstance(data, list) or len(data) != len(batch):
+        return [None] * len(batch)
+    return [resolve_fused_result(text, item) for text, item in zip(batch, data)]
+
+
+async def fetch_fused_batch(batch: list[str]) -> list:
+    content = await client.acall(
+        build_fused_preprocessing_batch_prompt(batch),
+        prompt_type="fused_preprocessing_batch",
+        # one unusable sentence means the batch is asked again rather than replayed
+        validate=lambda content: None not in resolve_fused_batch(batch, load_json_response(content)),
+    )
+    data = parse_response(content, "fused_preprocessing_batch") if content else None
+    return resolve_fused_batch(batch, data)
+
+
+async def normalize_spacing_and_detect_idioms_many(
+    texts: list[str], batch_size=BATCH_SIZE
+) -> list[tuple[str, list[tuple[int, int, str]]] | None]:
+    """Batched variant for whole transcripts; unusable entries come back as None."""
+    batches = [texts[i:i+batch_size] for i in range(0, len(texts), batch_size)]
+    results = []
+    for batch_results in await gather_with_limit(fetch_fused_batch(b) for b in batches):
+        results.extend(batch_results)
+    return results
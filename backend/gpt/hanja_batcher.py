@@ -1,9 +1,21 @@
 import json
-import time
-from backend.gpt.config import BATCH_SIZE
+from backend.gpt.config import BATCH_SIZE, MICRO_BATCH_WINDOW_MS
 
+from backend.gpt.micro_batcher import MicroBatcher, StreamingMicroBatcher
 from backend.gpt.openai_client import OpenAIClient
-from backend.gpt.utils import parse_response
+from backend.gpt.utils import (
+    gather_with_limit,
+    is_json_array,
+    iter_json_array_objects,
+    merge_streams,
+    parse_response,
+)
+from backend.gpt.word_store import (
+    hanja_store,
+    lookup_hanja_words,
+    merge_in_word_order,
+    save_entries,
+)
 
 client = OpenAIClient()
 
@@ -26,16 +38,73 @@ Format:
 ]
 """
 
-def generate_hanja_for_words(words, batch_size=BATCH_SIZE):
-    result = []
-    for i in range(0, len(words), batch_size):
-        batch = words[i:i+batch_size]
-        prompt = build_prompt(batch)
-        content = client.call(prompt)
-        data = parse_response(content)
+async def fetch_hanja_batch(batch: list[str]) -> tuple[dict, list[dict]]:
+    content = await client.acall(build_prompt(batch), prompt_type="hanja", validate=is_json_array)
+    data = parse_response(content, "hanja")
+    if not data:
+        return {}, []
+    return save_entries(hanja_store, data, "korean", batch)
 
-        if data:
-            result.extend(data)
-        time.sleep(1)  # to be respectful
 
-    return result
+async def fetch_hanja_micro_batch(words: list[str]) -> dict:
+    matched, _ = await fetch_hanja_batch(words)
+    return matched
+
+
+# merges the misses of concurrent requests into shared GPT batches
+hanja_micro_batcher = MicroBatcher(fetch_hanja_micro_batch)
+
+
+async def generate_hanja_for_words(words, batch_size=BATCH_SIZE):
+    # only words missing from the store are sent to GPT
+    entries_by_word, misses = lookup_hanja_words(words)
+
+    if MICRO_BATCH_WINDOW_MS > 0:
+        entries_by_word.update(await hanja_micro_batcher.submit(misses))
+        return merge_in_word_order(words, entries_by_word, [])
+
+    batches = [misses[i:i+batch_size] for i in range(0, len(misses), batch_size)]
+    unmatched = []
+
+    for matched, extra in await gather_with_limit(fetch_hanja_batch(b) for b in batches):
+        entries_by_word.update(matched)
+        unmatched.extend(extra)
+
+    return merge_in_word_order(words, entries_by_word, unmatched)
+
+
+async def stream_hanja_entries(batch: list[str]):
+    """Yield (word, entry) as each Hanja object streams in."""
+    prompt = build_prompt(batch)
+    async for entry in iter_json_array_objects(
+        client.astream(prompt, prompt_type="hanja", validate=is_json_array), "hanja"
+    ):
+        matched, _ = save_entries(hanja_store, [entry], "korean", batch)
+        for item in matched.items():
+            yield item
+
+
+async def stream_hanja_batch(batch: list[str]):
+    async for _, hanja_entry in stream_hanja_entries(batch):
+        yield "hanja", hanja_entry
+
+
+# streaming counterpart of hanja_micro_batcher, so shared batches still stream
+hanja_stream_batcher = StreamingMicroBatcher(stream_hanja_entries)
+
+
+async def stream_hanja_for_words(words, batch_size=BATCH_SIZE):
+    """Yield ("hanja", entry) pairs: stored words first, then GPT entries as they stream in."""
+    entries_by_word, misses = lookup_hanja_words(words)
+    for word in words:
+        if word in entries_by_word:
+            yield "hanja", entries_by_word[word]
+
+    if MICRO_BATCH_WINDOW_MS > 0:
+        async for _, entry in hanja_stream_batcher.submit_iter(misses):
+            yield "hanja", entry
+        return
+
+    batches = [misses[i:i+batch_size] for i in range(0, len(misses), batch_size)]
+    async for item in merge_streams(stream_hanja_batch(b) for b in batches):
+        yield item
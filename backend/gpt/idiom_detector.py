@@ -1,5 +1,6 @@
 from backend.gpt.openai_client import OpenAIClient
-from backend.gpt.utils import parse_response
+from backend.gpt.utils import is_json_array, parse_response
+from backend.metrics import STAGE_LATENCY
 
 client = OpenAIClient()
 
@@ -12,8 +13,9 @@ If none, return [].
 Sentence: {input_text}
 """
 
-def detect_idioms(text):
+async def detect_idioms(text):
     prompt = build_idiom_detection_prompt(text)
-    content = client.call(prompt)
+    with STAGE_LATENCY.time(stage="idiom"):
+        content = await client.acall(prompt, prompt_type="idiom", validate=is_json_array)
 
-    return parse_response(content)
+    return parse_response(content, "idiom")
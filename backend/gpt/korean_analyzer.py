@@ -1,9 +1,22 @@
 import json
-import time
 from backend.gpt.config import BATCH_SIZE
 
 from backend.gpt.openai_client import OpenAIClient
-from backend.gpt.utils import clean_json_response, parse_response
+from backend.gpt.utils import (
+    clean_json_response,
+    gather_with_limit,
+    is_json_array,
+    iter_json_array_objects,
+    load_json_response,
+    merge_streams,
+    parse_response,
+)
+from backend.gpt.word_store import (
+    definition_store,
+    lookup_words,
+    merge_in_word_order,
+    save_entries,
+)
 
 client = OpenAIClient()
 
@@ -30,25 +43,97 @@ Format:
 ]
     """
 
-def analyze_korean_sentence(text, words, batch_size=BATCH_SIZE):
-    sentence_gloss = None
-
-    if len(words) > 1:
-        gloss_prompt = build_input_gloss_prompt(text)
-        content = client.call(gloss_prompt)
-        sentence_gloss = normalize_gloss_response(content)
-
-    word_info = []
-    for i in range(0, len(words), batch_size):
-        batch = words[i:i+batch_size]
-        prompt = build_word_definition_prompt(batch)
-        content = client.call(prompt)
-        batch_info = parse_response(content)
-        if batch_info:
-            word_info.extend(batch_info)
-        time.sleep(1)  # to be respectful of rate limits
-
-    return sentence_gloss, word_info
+async def generate_sentence_gloss(text: str) -> str | None:
+    content = await client.acall(build_input_gloss_prompt(text), prompt_type="gloss")
+    return normalize_gloss_response(content)
+
+
+async def fetch_definition_batch(batch: list[str]) -> tuple[dict, list[dict]]:
+    content = await client.acall(
+        build_word_definition_prompt(batch), prompt_type="definitions", validate=is_json_array
+    )
+    batch_info = parse_response(content, "definitions")
+    if not batch_info:
+        return {}, []
+    return save_entries(definition_store, batch_info, "word", batch)
+
+
+async def generate_word_definitions(words, batch_size=BATCH_SIZE):
+    # only words missing from the store are sent to GPT
+    info_by_word, misses = lookup_words(definition_store, words)
+    batches = [misses[i:i+batch_size] for i in range(0, len(misses), batch_size)]
+    unmatched = []
+
+    for matched, extra in await gather_with_limit(fetch_definition_batch(b) for b in batches):
+        info_by_word.update(matched)
+        unmatched.extend(extra)
+
+    return merge_in_word_order(words, info_by_word, unmatched)
+
+
+def build_batch_gloss_prompt(texts):
+    return f"""
+Translate each Korean sentence into concise natural English.
+Explain idioms only if needed.
+Return only a JSON array of English sentences, one per input, in the same order.
+
+Sentences: {json.dumps(texts, ensure_ascii=False)}
+"""
+
+
+def resolve_gloss_batch(batch: list[str], glosses) -> list[str] | None:
+    if (
+        isinstance(glosses, list)
+        and len(glosses) == len(batch)
+        and all(isinstance(gloss, str) for gloss in glosses)
+    ):
+        return [gloss.strip() for gloss in glosses]
+    return None
+
+
+async def fetch_gloss_batch(batch: list[str]) -> list[str | None]:
+    content = await client.acall(
+        build_batch_gloss_prompt(batch),
+        prompt_type="gloss_batch",
+        validate=lambda content: resolve_gloss_batch(batch, load_json_response(content)) is not None,
+    )
+    glosses = resolve_gloss_batch(batch, parse_response(content, "gloss_batch") if content else None)
+    if glosses is not None:
+        return glosses
+
+    # misaligned answer: gloss each sentence on its own
+    return await gather_with_limit(generate_sentence_gloss(text) for text in batch)
+
+
+async def generate_sentence_glosses(texts, batch_size=BATCH_SIZE) -> list[str | None]:
+    """Gloss many sentences with one GPT call per `batch_size` sentences."""
+    batches = [texts[i:i+batch_size] for i in range(0, len(texts), batch_size)]
+    glosses = []
+    for batch_glosses in await gather_with_limit(fetch_gloss_batch(b) for b in batches):
+        glosses.extend(batch_glosses)
+    return glosses
+
+
+async def stream_definition_batch(batch: list[str]):
+    prompt = build_word_definition_prompt(batch)
+    async for entry in iter_json_array_objects(
+        client.astream(prompt, prompt_type="definitions", validate=is_json_array), "definitions"
+    ):
+        matched, _ = save_entries(definition_store, [entry], "word", batch)
+        for word_entry in matched.values():
+            yield "word", word_entry
+
+
+async def stream_word_definitions(words, batch_size=BATCH_SIZE):
+    """Yield ("word", entry) pairs: stored words first, then GPT entries as they stream in."""
+    info_by_word, misses = lookup_words(definition_store, words)
+    for word in words:
+        if word in info_by_word:
+            yield "word", info_by_word[word]
+
+    batches = [misses[i:i+batch_size] for i in range(0, len(misses), batch_size)]
+    async for item in merge_streams(stream_definition_batch(b) for b in batches):
+        yield item
 
 
 def normalize_gloss_response(content: str | None) -> str | None:
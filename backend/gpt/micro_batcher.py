@@ -0,0 +1,146 @@
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+from backend.gpt.config import BATCH_SIZE, GPT_CONCURRENCY, MICRO_BATCH_WINDOW_MS
+
+
+class MicroBatcher:
+    """
+    Collects keys submitted by concurrent requests for a short window (or until
+    `max_batch_size` keys are waiting), dedupes them, and resolves every waiter
+    from one `handler(keys) -> {key: result}` call.
+    Keys already waiting or in flight are joined rather than sent again, and at most
+    `max_concurrency` batches run at once, however many keys arrive together.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[list[str]], Awaitable[dict]],
+        max_batch_size: int = BATCH_SIZE,
+        window_seconds: float = MICRO_BATCH_WINDOW_MS / 1000,
+        max_concurrency: int = GPT_CONCURRENCY,
+    ):
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.window_seconds = window_seconds
+        self._pending: dict[str, asyncio.Future] = {}
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        # shared by every batch this batcher sends
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # the event loop only keeps weak references to tasks
+        self._tasks: set[asyncio.Task] = set()
+        self.batches_sent = 0
+        self.keys_submitted = 0
+
+    def _futures_for(self, keys: list[str]) -> dict[str, asyncio.Future]:
+        loop = asyncio.get_running_loop()
+        futures = {}
+
+        for key in dict.fromkeys(keys):
+            future = self._pending.get(key) or self._inflight.get(key)
+            if future is None:
+                future = loop.create_future()
+                self._pending[key] = future
+            futures[key] = future
+
+        self.keys_submitted += len(futures)
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._pending and self._timer is None:
+            self._timer = loop.call_later(self.window_seconds, self._flush)
+
+        return futures
+
+    async def submit(self, keys: list[str]) -> dict:
+        """Wait for every key; keys the handler had no result for are left out."""
+        futures = self._futures_for(keys)
+        results = await asyncio.gather(*(asyncio.shield(f) for f in futures.values()))
+        return {key: result for key, result in zip(futures, results) if result is not None}
+
+    async def submit_iter(self, keys: list[str]):
+        """Yield (key, result) pairs as each key's shared batch completes."""
+        futures = self._futures_for(keys)
+        key_by_future = {future: key for key, future in futures.items()}
+
+        pending = set(key_by_future)
+        while pending:
+            # asyncio.wait never cancels the shared futures, even if this waiter is cancelled
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                result = future.result()
+                if result is not None:
+                    yield key_by_future[future], result
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        pending = list(self._pending.items())
+        self._pending = {}
+
+        for i in range(0, len(pending), self.max_batch_size):
+            batch = dict(pending[i:i + self.max_batch_size])
+            self._inflight.update(batch)
+            task = asyncio.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[str, asyncio.Future]) -> None:
+        # queued keys stay in _inflight, so later submitters still join them
+        async with self._semaphore:
+            await self._send(batch)
+
+    async def _send(self, batch: dict[str, asyncio.Future]) -> None:
+        self.batches_sent += 1
+        try:
+            results = await self.handler(list(batch))
+            for key, future in batch.items():
+                if not future.done():
+                    future.set_result(results.get(key))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            for key in batch:
+                self._inflight.pop(key, None)
+
+
+class StreamingMicroBatcher(MicroBatcher):
+    """
+    MicroBatcher whose `handler(keys)` is an async iterator of (key, result) pairs,
+    e.g. objects parsed off a streamed completion. Each waiter is resolved as soon as
+    its own key arrives instead of when the whole batch finishes.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[list[str]], AsyncIterator[tuple[str, object]]],
+        max_batch_size: int = BATCH_SIZE,
+        window_seconds: float = MICRO_BATCH_WINDOW_MS / 1000,
+        max_concurrency: int = GPT_CONCURRENCY,
+    ):
+        super().__init__(handler, max_batch_size, window_seconds, max_concurrency)
+
+    async def _send(self, batch: dict[str, asyncio.Future]) -> None:
+        self.batches_sent += 1
+        try:
+            async for key, result in self.handler(list(batch)):
+                future = batch.get(key)
+                if future is not None and not future.done():
+                    future.set_result(result)
+            # keys the stream never produced
+            for future in batch.values():
+                if not future.done():
+                    future.set_result(None)
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            for key in batch:
+                self._inflight.pop(key, None)
@@ -1,38 +1,376 @@
 import os
+import json
 import time
+import asyncio
+import hashlib
+from collections.abc import Callable
 
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, OpenAI, RateLimitError
 
 from dotenv import load_dotenv
 
+from backend.gpt.config import (
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_MAX_ENTRIES,
+    LLM_CACHE_PATH,
+    LLM_CACHE_TTL_SECONDS,
+    OPENAI_MAX_CONNECTIONS,
+    OPENAI_BACKEND,
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+    OPENAI_TIMEOUT,
+)
+from backend.gpt.disk_cache import DiskCache
+from backend.metrics import (
+    OPENAI_CACHE_HITS,
+    OPENAI_CALLS,
+    OPENAI_RETRIES,
+    OPENAI_TOKENS,
+    STAGE_LATENCY,
+)
+from backend.gpt.single_flight import SingleFlight
+from backend.gpt.rate_limiter import (
+    backoff_delay,
+    estimate_tokens,
+    get_rate_limiter,
+    parse_retry_after,
+)
+
 # Go up one directory to load the shared root-level .env
 env_path = os.path.join(os.path.dirname(__file__), "../.env")
 load_dotenv(dotenv_path=env_path)
 
+SYSTEM_PROMPT = "You are a precise linguistic assistant."
+
+response_cache = DiskCache(
+    LLM_CACHE_PATH,
+    table="chat_completions",
+    max_entries=LLM_CACHE_MAX_ENTRIES,
+    ttl_seconds=LLM_CACHE_TTL_SECONDS,
+)
+
+
+# identical prompts issued concurrently (e.g. many users clicking the same subtitle) share one call
+inflight_requests = SingleFlight()
+
+
+def build_cache_key(model: str, temperature: float, prompt: str) -> str:
+    payload = json.dumps(
+        [model, temperature, SYSTEM_PROMPT, prompt], ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_cached_completion(
+    cache_key: str, validate: Callable[[str], bool] | None, prompt_type: str
+) -> str | None:
+    cached = response_cache.get(cache_key)
+    if cached is None:
+        return None
+    if validate is not None and not validate(cached):
+        # an unusable completion would otherwise be replayed until it expires
+        response_cache.delete(cache_key)
+        return None
+    OPENAI_CACHE_HITS.inc(prompt_type=prompt_type)
+    return cached
+
+
+def cache_completion(
+    cache_key: str, content: str, validate: Callable[[str], bool] | None
+) -> None:
+    # temperature-0 prompts would get a malformed answer back for every identical request
+    if content and (validate is None or validate(content)):
+        response_cache.set(cache_key, content)
+
+
+def record_token_usage(prompt_type: str, usage) -> None:
+    if usage is None:
+        return
+    OPENAI_TOKENS.inc(usage.prompt_tokens, prompt_type=prompt_type, kind="prompt")
+    OPENAI_TOKENS.inc(usage.completion_tokens, prompt_type=prompt_type, kind="completion")
+
+
+def build_messages(prompt: str) -> list[dict]:
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": prompt},
+    ]
+
+
 class OpenAIClient:
     _client = None
+    _async_client = None
 
     @classmethod
     def get_client(cls) -> OpenAI:
         if cls._client is None:
-            cls._client = OpenAI(api_key=os.environ["OPENAI_API_KEY"])
+            if OPENAI_BACKEND == "fake":
+                from backend.gpt.fake_openai import FakeOpenAI
+
+                cls._client = FakeOpenAI()
+            else:
+                cls._client = OpenAI(api_key=os.environ["OPENAI_API_KEY"])
         return cls._client
 
     @classmethod
-    def call(cls, prompt: str, model: str = "gpt-4o", retries: int = 2, temperature: float = 0.0) -> str | None:
+    def get_async_client(cls) -> AsyncOpenAI:
+        """
+        Shared async client so every request reuses one keep-alive connection pool.
+        Retries are handled in `acall`, so the SDK's own retries are disabled.
+        """
+        if cls._async_client is None and OPENAI_BACKEND == "fake":
+            from backend.gpt.fake_openai import FakeAsyncOpenAI
+
+            cls._async_client = FakeAsyncOpenAI()
+
+        if cls._async_client is None:
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=OPENAI_MAX_CONNECTIONS,
+                    max_keepalive_connections=OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+                timeout=OPENAI_TIMEOUT,
+            )
+            cls._async_client = AsyncOpenAI(
+                api_key=os.environ["OPENAI_API_KEY"],
+                http_client=http_client,
+                max_retries=0,
+            )
+        return cls._async_client
+
+    @classmethod
+    def call(
+        cls,
+        prompt: str,
+        model: str = "gpt-4o",
+        retries: int = 2,
+        temperature: float = 0.0,
+        use_cache: bool = LLM_CACHE_ENABLED,
+        prompt_type: str = "other",
+        validate: Callable[[str], bool] | None = None,
+    ) -> str | None:
+        cache_key = build_cache_key(model, temperature, prompt)
+        if use_cache:
+            cached = get_cached_completion(cache_key, validate, prompt_type)
+            if cached is not None:
+                return cached
+
         client = cls.get_client()
         for attempt in range(retries):
+            if attempt:
+                OPENAI_RETRIES.inc(prompt_type=prompt_type)
             try:
                 response = client.chat.completions.create(
                     model=model,
                     temperature=temperature,
-                    messages=[
-                        {"role": "system", "content": "You are a precise linguistic assistant."},
-                        {"role": "user", "content": prompt}
-                    ]
+                    messages=build_messages(prompt),
                 )
-                return response.choices[0].message.content.strip()
+                OPENAI_CALLS.inc(prompt_type=prompt_type, model=model, outcome="ok")
+                record_token_usage(prompt_type, response.usage)
+                content = response.choices[0].message.content.strip()
+                if use_cache:
+                    cache_completion(cache_key, content, validate)
+                return content
             except Exception as e:
+                OPENAI_CALLS.inc(prompt_type=prompt_type, model=model, outcome="error")
                 print(f"[Attempt {attempt+1}] OpenAI API error: {e}")
                 time.sleep(1)
         return None
+
+    @classmethod
+    def embed(cls, text: str, model: str = "text-embedding-3-small") -> list[float]:
+        client = cls.get_client()
+        try:
+            with STAGE_LATENCY.time(stage="embedding"):
+                response = client.embeddings.create(model=model, input=[text])
+        except Exception:
+            OPENAI_CALLS.inc(prompt_type="embedding", model=model, outcome="error")
+            raise
+
+        OPENAI_CALLS.inc(prompt_type="embedding", model=model, outcome="ok")
+        if response.usage:
+            OPENAI_TOKENS.inc(response.usage.prompt_tokens, prompt_type="embedding", kind="prompt")
+        return response.data[0].embedding
+
+    @classmethod
+    async def acall(
+        cls,
+        prompt: str,
+        model: str = "gpt-4o",
+        retries: int = 2,
+        temperature: float = 0.0,
+        timeout: float = OPENAI_TIMEOUT,
+        use_cache: bool = LLM_CACHE_ENABLED,
+        prompt_type: str = "other",
+        validate: Callable[[str], bool] | None = None,
+    ) -> str | None:
+        """
+        Async variant of `call` that never blocks the event loop. A completion is only
+        cached (and a cached one only replayed) if `validate` accepts it.
+        """
+        cache_key = build_cache_key(model, temperature, prompt)
+        if use_cache:
+            cached = get_cached_completion(cache_key, validate, prompt_type)
+            if cached is not None:
+                return cached
+
+        return await inflight_requests.do(
+            cache_key,
+            lambda: cls._acall_uncached(
+                prompt, model, retries, temperature, timeout, use_cache, cache_key, prompt_type,
+                validate,
+            ),
+        )
+
+    @classmethod
+    async def _acall_uncached(
+        cls,
+        prompt: str,
+        model: str,
+        retries: int,
+        temperature: float,
+        timeout: float,
+        use_cache: bool,
+        cache_key: str,
+        prompt_type: str,
+        validate: Callable[[str], bool] | None,
+    ) -> str | None:
+        client = cls.get_async_client()
+        limiter = get_rate_limiter(model)
+        estimated_tokens = estimate_tokens(SYSTEM_PROMPT + prompt)
+
+        for attempt in range(retries):
+            retry_after = None
+            if attempt:
+                OPENAI_RETRIES.inc(prompt_type=prompt_type)
+            await limiter.acquire(estimated_tokens)
+            try:
+                raw_response = await client.chat.completions.with_raw_response.create(
+                    model=model,
+                    temperature=temperature,
+                    messages=build_messages(prompt),
+                    timeout=timeout,
+                )
+                limiter.update_from_headers(raw_response.headers)
+                response = raw_response.parse()
+                OPENAI_CALLS.inc(prompt_type=prompt_type, model=model, outcome="ok")
+                if response.usage:
+                    limiter.record_usage(estimated_tokens, response.usage.total_tokens)
+                    record_token_usage(prompt_type, response.usage)
+
+                content = response.choices[0].message.content.strip()
+                if use_cache:
+                    cache_completion(cache_key, content, validate)
+                return content
+            except RateLimitError as e:
+                OPENAI_CALLS.inc(prompt_type=prompt_type, model=model, outcome="rate_limited")
+                retry_after = parse_retry_after(e.response.headers)
+                if retry_after is not None:
+                    limiter.block_for(retry_after)
+                print(f"[Attempt {attempt+1}] OpenAI rate limited: {e}")
+            except Exception as e:
+                OPENAI_CALLS.inc(prompt_type=prompt_type, model=model, outcome="error")
+                print(f"[Attempt {attempt+1}] OpenAI API error: {e}")
+
+            if attempt + 1 < retries:
+                await asyncio.sleep(backoff_delay(attempt, retry_after))
+        return None
+
+    @classmethod
+    async def astream(
+        cls,
+        prompt: str,
+        model: str = "gpt-4o",
+        retries: int = 2,
+        temperature: float = 0.0,
+        timeout: float = OPENAI_TIMEOUT,
+        use_cache: bool = LLM_CACHE_ENABLED,
+        prompt_type: str = "other",
+        validate: Callable[[str], bool] | None = None,
+    ):
+        """
+        Yield completion text as the model generates it.
+        Cached completions are replayed as a single chunk; retries only happen
+        before the first chunk has been handed to the caller.
+        """
+        cache_key = build_cache_key(model, temperature, prompt)
+        if use_cache:
+            cached = get_cached_completion(cache_key, validate, prompt_type)
+            if cached is not None:
+                yield cached
+                return
+
+        # concurrent identical prompts follow one shared stream (or an in-flight acall)
+        async for chunk in inflight_requests.stream(
+            cache_key,
+            lambda: cls._astream_uncached(
+                prompt, model, retries, temperature, timeout, use_cache, cache_key, prompt_type,
+                validate,
+            ),
+        ):
+            yield chunk
+
+    @classmethod
+    async def _astream_uncached(
+        cls,
+        prompt: str,
+        model: str,
+        retries: int,
+        temperature: float,
+        timeout: float,
+        use_cache: bool,
+        cache_key: str,
+        prompt_type: str,
+        validate: Callable[[str], bool] | None,
+    ):
+        client = cls.get_async_client()
+        limiter = get_rate_limiter(model)
+        estimated_tokens = estimate_tokens(SYSTEM_PROMPT + prompt)
+
+        for attempt in range(retries):
+            retry_after = None
+            received: list[str] = []
+            if attempt:
+                OPENAI_RETRIES.inc(prompt_type=prompt_type)
+            await limiter.acquire(estimated_tokens)
+            try:
+                stream = await client.chat.completions.create(
+                    model=model,
+                    temperature=temperature,
+                    messages=build_messages(prompt),
+                    timeout=timeout,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                )
+                limiter.update_from_headers(stream.response.headers)
+
+                async for chunk in stream:
+                    # with include_usage, the final chunk carries usage and no choices
+                    if chunk.usage:
+                        limiter.record_usage(estimated_tokens, chunk.usage.total_tokens)
+                        record_token_usage(prompt_type, chunk.usage)
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        received.append(delta)
+                        yield delta
+
+                OPENAI_CALLS.inc(prompt_type=prompt_type, model=model, outcome="ok")
+                if use_cache:
+                    cache_completion(cache_key, "".join(received).strip(), validate)
+                return
+            except RateLimitError as e:
+                OPENAI_CALLS.inc(prompt_type=prompt_type, model=model, outcome="rate_limited")
+                retry_after = parse_retry_after(e.response.headers)
+                if retry_after is not None:
+                    limiter.block_for(retry_after)
+                print(f"[Attempt {attempt+1}] OpenAI rate limited: {e}")
+            except Exception as e:
+                OPENAI_CALLS.inc(prompt_type=prompt_type, model=model, outcome="error")
+                print(f"[Attempt {attempt+1}] OpenAI API error: {e}")
+
+            if received:
+                return
+            if attempt + 1 < retries:
+                await asyncio.sleep(backoff_delay(attempt, retry_after))
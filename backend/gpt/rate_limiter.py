@@ -0,0 +1,145 @@
+import re
+import time
+import random
+import asyncio
+
+from backend.gpt.config import (
+    OPENAI_REQUESTS_PER_MINUTE,
+    OPENAI_TOKENS_PER_MINUTE,
+)
+
+DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+
+class TokenBucket:
+    """Continuously refilling bucket; `capacity` units become available per minute."""
+
+    def __init__(self, capacity: float):
+        self.capacity = capacity
+        self.available = capacity
+        self.updated_at = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        rate = self.capacity / 60
+        self.available = min(self.capacity, self.available + (now - self.updated_at) * rate)
+        self.updated_at = now
+
+    def wait_time(self, amount: float) -> float:
+        # never wait on requests larger than the whole bucket; just drain it
+        amount = min(amount, self.capacity)
+        if self.available >= amount:
+            return 0.0
+        return (amount - self.available) / (self.capacity / 60)
+
+
+class RateLimiter:
+    """
+    Requests/min + tokens/min budget shared by every caller of one model.
+    Budgets start from config and are corrected from OpenAI's `x-ratelimit-*` headers,
+    so callers only wait when the upstream quota is actually close to exhausted.
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.blocked_until = 0.0
+
+    def _reserve(self, tokens: int) -> float:
+        now = time.monotonic()
+        self.requests.refill(now)
+        self.tokens.refill(now)
+
+        wait = max(
+            self.blocked_until - now,
+            self.requests.wait_time(1),
+            self.tokens.wait_time(tokens),
+        )
+        if wait <= 0:
+            self.requests.available -= 1
+            self.tokens.available -= min(tokens, self.tokens.capacity)
+        return wait
+
+    async def acquire(self, tokens: int) -> None:
+        while True:
+            wait = self._reserve(tokens)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int) -> None:
+        self.tokens.available -= actual_tokens - estimated_tokens
+
+    def block_for(self, seconds: float) -> None:
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+    def update_from_headers(self, headers) -> None:
+        for bucket, kind in ((self.requests, "requests"), (self.tokens, "tokens")):
+            limit = headers.get(f"x-ratelimit-limit-{kind}")
+            remaining = headers.get(f"x-ratelimit-remaining-{kind}")
+            reset = headers.get(f"x-ratelimit-reset-{kind}")
+
+            if limit and limit.isdigit():
+                bucket.capacity = float(limit)
+            if remaining and remaining.isdigit():
+                bucket.available = min(bucket.available, float(remaining))
+                if int(remaining) == 0 and reset:
+                    self.block_for(parse_duration(reset))
+
+
+def parse_duration(value: str) -> float:
+    """Parse OpenAI reset durations such as `20ms`, `1s` or `6m0s` into seconds."""
+    parts = DURATION_PART.findall(value)
+    if not parts:
+        try:
+            return float(value)
+        except ValueError:
+            return 0.0
+    return sum(float(amount) * DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def parse_retry_after(headers) -> float | None:
+    if headers is None:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            return None
+    return None
+
+
+def backoff_delay(
+    attempt: int, retry_after: float | None = None, base: float = 0.5, cap: float = 20.0
+) -> float:
+    """Honor an explicit retry-after, otherwise use full-jitter exponential backoff."""
+    if retry_after is not None:
+        return retry_after
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+def estimate_tokens(text: str, max_output_tokens: int = 500) -> int:
+    # Hangul is roughly one token per syllable; ASCII averages ~4 chars per token
+    hangul = sum(1 for ch in text if "가" <= ch <= "힣")
+    return hangul + (len(text) - hangul) // 4 + max_output_tokens
+
+
+_limiters: dict[str, RateLimiter] = {}
+
+
+def get_rate_limiter(model: str) -> RateLimiter:
+    """OpenAI enforces limits per model, so each model gets its own process-wide limiter."""
+    if model not in _limiters:
+        _limiters[model] = RateLimiter(
+            OPENAI_REQUESTS_PER_MINUTE, OPENAI_TOKENS_PER_MINUTE
+        )
+    return _limiters[model]
@@ -0,0 +1,94 @@
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+
+class SharedStream:
+    """
+    Drains one async iterator in its own task, buffering every chunk so any number
+    of followers can replay what has arrived so far and then keep up with the rest.
+    """
+
+    def __init__(self, stream: AsyncIterator):
+        self.chunks: list = []
+        self.done = False
+        self.error: Exception | None = None
+        self._changed = asyncio.Event()
+        self.task = asyncio.ensure_future(self._pump(stream))
+
+    async def _pump(self, stream: AsyncIterator) -> None:
+        try:
+            async for chunk in stream:
+                self.chunks.append(chunk)
+                self._notify()
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done = True
+            self._notify()
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def follow(self):
+        position = 0
+        while True:
+            while position < len(self.chunks):
+                yield self.chunks[position]
+                position += 1
+            if self.done:
+                if self.error is not None:
+                    raise self.error
+                return
+            await self._changed.wait()
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls that share a key into one in-flight task.
+    The shared task is shielded, so a caller that disconnects does not cancel it for the rest.
+    """
+
+    def __init__(self):
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._streams: dict[str, SharedStream] = {}
+        self.shared = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable]):
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.shared += 1
+
+        return await asyncio.shield(task)
+
+    async def stream(self, key: str, fn: Callable[[], AsyncIterator]):
+        """
+        Streaming variant of `do`: callers for the same key follow one shared stream.
+        A non-streaming call already in flight for the key is joined instead, and its
+        result is yielded as a single chunk.
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            self.shared += 1
+            result = await asyncio.shield(task)
+            if result:
+                yield result
+            return
+
+        shared_stream = self._streams.get(key)
+        if shared_stream is None:
+            shared_stream = SharedStream(fn())
+            self._streams[key] = shared_stream
+            shared_stream.task.add_done_callback(lambda _: self._streams.pop(key, None))
+        else:
+            self.shared += 1
+
+        async for chunk in shared_stream.follow():
+            yield chunk
+
+    def in_flight(self) -> int:
+        return len(self._inflight) + len(self._streams)
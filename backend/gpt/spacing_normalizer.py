@@ -1,4 +1,5 @@
 from backend.gpt.openai_client import OpenAIClient
+from backend.metrics import STAGE_LATENCY
 
 client = OpenAIClient()
 
@@ -13,12 +14,14 @@ Text: {text}
 """
 
 
-def normalize_korean_spacing(text: str) -> str:
-    content = client.call(
-        build_spacing_prompt(text),
-        model="gpt-4o-mini",
-        temperature=0.0,
-    )
+async def normalize_korean_spacing(text: str) -> str:
+    with STAGE_LATENCY.time(stage="spacing"):
+        content = await client.acall(
+            build_spacing_prompt(text),
+            model="gpt-4o-mini",
+            temperature=0.0,
+            prompt_type="spacing",
+        )
 
     if not content:
         return text
@@ -1,5 +1,10 @@
 import re
 import json
+import asyncio
+
+from backend.gpt.config import GPT_CONCURRENCY
+from backend.metrics import OPENAI_PARSE_FAILURES
+
 
 def clean_json_response(text):
     """
@@ -12,12 +17,148 @@ def clean_json_response(text):
     else:
         return text.strip()  # Fallback: try parsing whole response as-is
 
-def parse_response(content):
+def parse_response(content, prompt_type="other"):
     try:
         cleaned = clean_json_response(content)
         return json.loads(cleaned)
     except Exception as e:
+        if content is not None:
+            OPENAI_PARSE_FAILURES.inc(prompt_type=prompt_type)
         print("⚠️ Failed to parse JSON. Error:", e)
         print("Raw content:")
         print(content)
-        return None
\ No newline at end of file
+        return None
+
+def load_json_response(content):
+    """`parse_response` without the failure logging, for validating completions."""
+    try:
+        return json.loads(clean_json_response(content))
+    except (TypeError, ValueError):
+        return None
+
+def is_json_array(content) -> bool:
+    return isinstance(load_json_response(content), list)
+
+async def gather_with_limit(coroutines, limit=GPT_CONCURRENCY):
+    """Run coroutines concurrently, at most `limit` at a time, returning results in order."""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coroutine):
+        async with semaphore:
+            return await coroutine
+
+    return await asyncio.gather(*(run(coroutine) for coroutine in coroutines))
+
+
+class JsonArrayStreamParser:
+    """
+    Incrementally parses a streamed JSON array of objects.
+    `feed` returns every object completed so far, ignoring any text around the array
+    (e.g. a ```json fence) and skipping objects that fail to parse.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.position = 0
+        self.in_array = False
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.object_start = None
+        self.failures = 0
+
+    def feed(self, chunk: str) -> list[dict]:
+        self.buffer += chunk
+        completed = []
+
+        while self.position < len(self.buffer):
+            char = self.buffer[self.position]
+
+            if not self.in_array:
+                self.in_array = char == "["
+            elif self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char in "{[":
+                if self.depth == 0:
+                    self.object_start = self.position
+                self.depth += 1
+            elif char in "}]":
+                if self.depth == 0:
+                    # end of the top-level array
+                    self.in_array = False
+                else:
+                    self.depth -= 1
+                    if self.depth == 0:
+                        completed.extend(self._parse_object())
+
+            self.position += 1
+
+        # drop consumed text that can no longer be part of an object
+        if self.depth == 0:
+            self.buffer = self.buffer[self.position:]
+            self.position = 0
+        return completed
+
+    def _parse_object(self) -> list[dict]:
+        raw = self.buffer[self.object_start:self.position + 1]
+        try:
+            parsed = json.loads(raw)
+        except json.JSONDecodeError:
+            self.failures += 1
+            print("⚠️ Failed to parse streamed JSON object:", raw)
+            return []
+        return [parsed] if isinstance(parsed, dict) else []
+
+
+async def iter_json_array_objects(chunks, prompt_type="other"):
+    """Yield each object of a JSON array as soon as it is complete in the text stream."""
+    parser = JsonArrayStreamParser()
+    try:
+        async for chunk in chunks:
+            for parsed in parser.feed(chunk):
+                yield parsed
+    finally:
+        if parser.failures:
+            OPENAI_PARSE_FAILURES.inc(parser.failures, prompt_type=prompt_type)
+
+
+async def merge_streams(streams, limit=GPT_CONCURRENCY):
+    """
+    Drain async generators concurrently (at most `limit` at a time), yielding items
+    in arrival order. Pending streams are cancelled if the consumer stops early.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    semaphore = asyncio.Semaphore(limit)
+    finished = object()
+
+    async def drain(stream):
+        try:
+            async with semaphore:
+                async for item in stream:
+                    await queue.put(item)
+        finally:
+            await queue.put(finished)
+
+    tasks = [asyncio.create_task(drain(stream)) for stream in streams]
+    remaining = len(tasks)
+
+    try:
+        while remaining:
+            item = await queue.get()
+            if item is finished:
+                remaining -= 1
+                continue
+            yield item
+
+        for task in tasks:
+            task.result()  # surface any stream failure
+    finally:
+        for task in tasks:
+            task.cancel()
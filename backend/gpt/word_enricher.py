@@ -0,0 +1,199 @@
+import json
+
+from backend.gpt.config import BATCH_SIZE, MICRO_BATCH_WINDOW_MS
+from backend.gpt.micro_batcher import MicroBatcher, StreamingMicroBatcher
+from backend.gpt.openai_client import OpenAIClient
+from backend.gpt.utils import (
+    gather_with_limit,
+    is_json_array,
+    iter_json_array_objects,
+    merge_streams,
+    parse_response,
+)
+from backend.gpt.word_store import (
+    definition_store,
+    hanja_store,
+    lookup_hanja_words,
+    lookup_words,
+    merge_in_word_order,
+    save_entries,
+)
+
+client = OpenAIClient()
+
+
+def build_enrichment_prompt(words):
+    return f"""
+For each Korean item, return JSON with:
+korean, hanja, characters, pos, definition, example.
+If no Hanja origin, use "hanja": "" and "characters": [].
+Use a new Korean example sentence for each item.
+
+Items: {json.dumps(words, ensure_ascii=False)}
+
+Format:
+[
+  {{
+    "korean":"유유자적",
+    "hanja":"悠悠自適",
+    "characters":[
+      {{"char":"悠","korean_gloss":"멀 유","pinyin":"yōu","english_gloss":"distant"}}
+    ],
+    "pos":"idiom",
+    "definition":"living a leisurely life free from worldly cares",
+    "example":"은퇴 후 시골에서 유유자적하며 지낸다."
+  }}
+]
+"""
+
+
+def split_hanja_entry(entry: dict) -> dict:
+    return {
+        "korean": entry.get("korean"),
+        "hanja": entry.get("hanja", ""),
+        "characters": entry.get("characters", []),
+    }
+
+
+def split_definition_entry(entry: dict) -> dict:
+    return {
+        "word": entry.get("korean"),
+        "pos": entry.get("pos"),
+        "definition": entry.get("definition"),
+        "example": entry.get("example"),
+    }
+
+
+async def fetch_enrichment_batch(batch: list[str]) -> tuple[dict, dict]:
+    content = await client.acall(
+        build_enrichment_prompt(batch), prompt_type="enrichment", validate=is_json_array
+    )
+    data = parse_response(content, "enrichment")
+    if not isinstance(data, list):
+        return {}, {}
+
+    entries = [entry for entry in data if isinstance(entry, dict)]
+    # every enriched word fills both stores, whichever list it was requested for
+    hanja_entries, _ = save_entries(
+        hanja_store, [split_hanja_entry(e) for e in entries], "korean", batch
+    )
+    definition_entries, _ = save_entries(
+        definition_store, [split_definition_entry(e) for e in entries], "word", batch
+    )
+    return hanja_entries, definition_entries
+
+
+async def fetch_enrichment_micro_batch(words: list[str]) -> dict:
+    hanja_entries, definition_entries = await fetch_enrichment_batch(words)
+    return {
+        word: {"hanja": hanja_entries.get(word), "word": definition_entries.get(word)}
+        for word in words
+        if word in hanja_entries or word in definition_entries
+    }
+
+
+# merges the misses of concurrent requests into shared GPT batches
+enrichment_micro_batcher = MicroBatcher(fetch_enrichment_micro_batch)
+
+
+async def enrich_words(
+    hanja_words: list[str], definition_words: list[str], batch_size=BATCH_SIZE
+) -> tuple[list[dict], list[dict]]:
+    """
+    Send the union of both word lists to GPT once and split each answer back
+    into the `hanja_words` and `word_info` shapes.
+    """
+    hanja_by_word, hanja_misses = lookup_hanja_words(hanja_words)
+    info_by_word, info_misses = lookup_words(definition_store, definition_words)
+
+    misses = list(dict.fromkeys(hanja_misses + info_misses))
+
+    if MICRO_BATCH_WINDOW_MS > 0:
+        for word, halves in (await enrichment_micro_batcher.submit(misses)).items():
+            if halves["hanja"]:
+                hanja_by_word[word] = halves["hanja"]
+            if halves["word"]:
+                info_by_word[word] = halves["word"]
+        return (
+            merge_in_word_order(hanja_words, hanja_by_word, []),
+            merge_in_word_order(definition_words, info_by_word, []),
+        )
+
+    batches = [misses[i:i+batch_size] for i in range(0, len(misses), batch_size)]
+
+    for hanja_entries, definition_entries in await gather_with_limit(
+        fetch_enrichment_batch(batch) for batch in batches
+    ):
+        hanja_by_word.update(hanja_entries)
+        info_by_word.update(definition_entries)
+
+    return (
+        merge_in_word_order(hanja_words, hanja_by_word, []),
+        merge_in_word_order(definition_words, info_by_word, []),
+    )
+
+
+async def stream_enrichment_entries(batch: list[str]):
+    """Yield (word, {"hanja": entry, "word": entry}) as each enriched object streams in."""
+    prompt = build_enrichment_prompt(batch)
+    async for entry in iter_json_array_objects(
+        client.astream(prompt, prompt_type="enrichment", validate=is_json_array), "enrichment"
+    ):
+        hanja_entries, _ = save_entries(
+            hanja_store, [split_hanja_entry(entry)], "korean", batch
+        )
+        definition_entries, _ = save_entries(
+            definition_store, [split_definition_entry(entry)], "word", batch
+        )
+        for word in dict.fromkeys([*hanja_entries, *definition_entries]):
+            yield word, {"hanja": hanja_entries.get(word), "word": definition_entries.get(word)}
+
+
+async def stream_enrichment_batch(batch: list[str]):
+    async for _, halves in stream_enrichment_entries(batch):
+        for kind in ("hanja", "word"):
+            if halves[kind]:
+                yield kind, halves[kind]
+
+
+# streaming counterpart of enrichment_micro_batcher, so shared batches still stream
+enrichment_stream_batcher = StreamingMicroBatcher(stream_enrichment_entries)
+
+
+async def stream_enrichment_micro_batch(words: list[str]):
+    async for _, halves in enrichment_stream_batcher.submit_iter(words):
+        for kind in ("hanja", "word"):
+            if halves[kind]:
+                yield kind, halves[kind]
+
+
+async def stream_enriched_words(
+    hanja_words: list[str], definition_words: list[str], batch_size=BATCH_SIZE
+):
+    """
+    Streaming variant of `enrich_words`, yielding ("hanja", entry) and
+    ("word", entry) pairs as soon as each one is ready.
+    """
+    hanja_by_word, hanja_misses = lookup_hanja_words(hanja_words)
+    info_by_word, info_misses = lookup_words(definition_store, definition_words)
+
+    for word in hanja_words:
+        if word in hanja_by_word:
+            yield "hanja", hanja_by_word[word]
+    for word in definition_words:
+        if word in info_by_word:
+            yield "word", info_by_word[word]
+
+    misses = list(dict.fromkeys(hanja_misses + info_misses))
+    if MICRO_BATCH_WINDOW_MS > 0:
+        streams = [stream_enrichment_micro_batch(misses)]
+    else:
+        batches = [misses[i:i+batch_size] for i in range(0, len(misses), batch_size)]
+        streams = [stream_enrichment_batch(batch) for batch in batches]
+
+    # only forward the half each word was actually requested for
+    wanted = {"hanja": set(hanja_misses), "word": set(info_misses)}
+    async for kind, payload in merge_streams(streams):
+        word = payload["korean"] if kind == "hanja" else payload["word"]
+        if word in wanted[kind]:
+            yield kind, payload
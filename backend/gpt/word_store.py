@@ -0,0 +1,100 @@
+import hashlib
+
+from backend.gpt.config import (
+    WORD_STORE_ENABLED,
+    WORD_STORE_MAX_ENTRIES,
+    WORD_STORE_PATH,
+)
+from backend.gpt.disk_cache import DiskCache
+from backend.language_analysis.hanja_dictionary import hanja_index
+
+hanja_store = DiskCache(
+    WORD_STORE_PATH, table="hanja_words", max_entries=WORD_STORE_MAX_ENTRIES
+)
+definition_store = DiskCache(
+    WORD_STORE_PATH, table="word_definitions", max_entries=WORD_STORE_MAX_ENTRIES
+)
+
+
+_word_store_version = None
+
+
+def get_word_store_version() -> str:
+    """
+    Hash of the prompts that produce stored entries (Hanja, definitions, enrichment).
+    Unlike PIPELINE_VERSION it ignores grammar rules, the Komoran dictionary and the
+    rest of the GPT modules, none of which change what a word's entry says.
+    """
+    global _word_store_version
+    if _word_store_version is None:
+        # imported here: these modules import the store
+        from backend.gpt.hanja_batcher import build_prompt
+        from backend.gpt.korean_analyzer import build_word_definition_prompt
+        from backend.gpt.word_enricher import build_enrichment_prompt
+
+        digest = hashlib.sha256()
+        for build in (build_prompt, build_word_definition_prompt, build_enrichment_prompt):
+            # rendering with a fixed word captures edits to the template text only
+            digest.update(build(["단어"]).encode("utf-8"))
+        _word_store_version = digest.hexdigest()[:16]
+    return _word_store_version
+
+
+def build_word_key(word: str) -> str:
+    # entries written by older prompts are never read back once the prompts change
+    return f"{get_word_store_version()}\0{word}"
+
+
+def lookup_words(store: DiskCache, words: list[str]) -> tuple[dict, list[str]]:
+    """Split words into stored entries and the unique misses that still need GPT."""
+    stored = {}
+    if WORD_STORE_ENABLED:
+        found = store.get_many([build_word_key(word) for word in words])
+        stored = {word: found[build_word_key(word)] for word in words if build_word_key(word) in found}
+
+    misses: list[str] = []
+    for word in words:
+        if word not in stored and word not in misses:
+            misses.append(word)
+
+    return stored, misses
+
+
+def lookup_hanja_words(words: list[str]) -> tuple[dict, list[str]]:
+    """Consult the offline Hanja index, then the store; only what is left needs GPT."""
+    indexed = hanja_index.lookup_many(words)
+    stored, misses = lookup_words(hanja_store, [w for w in words if w not in indexed])
+    return {**indexed, **stored}, misses
+
+
+def save_entries(
+    store: DiskCache, entries: list[dict], key: str, requested: list[str]
+) -> tuple[dict, list[dict]]:
+    """
+    Index GPT entries by `key` and persist the ones that answer a requested word.
+    Entries GPT returned for words we did not ask about are passed back separately.
+    """
+    requested_set = set(requested)
+    matched: dict = {}
+    unmatched: list[dict] = []
+
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+
+        word = entry.get(key)
+        if word in requested_set and word not in matched:
+            matched[word] = entry
+        else:
+            unmatched.append(entry)
+
+    if WORD_STORE_ENABLED:
+        store.set_many({build_word_key(word): entry for word, entry in matched.items()})
+    return matched, unmatched
+
+
+def merge_in_word_order(
+    words: list[str], entries_by_word: dict, unmatched: list[dict]
+) -> list[dict]:
+    merged = [entries_by_word[word] for word in words if word in entries_by_word]
+    return merged + unmatched
@@ -51,6 +51,12 @@ def extract_korean_readings(soup):
     return list(readings)
 
 
+def extract_korean_hun(soup):
+    """The hun (native gloss) of the Korean eumhun line, e.g. "멀" from "eumhun 멀 유"."""
+    match = re.search(r"eumhun\W*([가-힣]+(?: [가-힣]+)*) [가-힣]\b", soup.get_text(" "))
+    return match.group(1) if match else ""
+
+
 def build_char_and_reverse_dict(unique_hanja_chars):
     char_dict = {}
     reverse_dict = defaultdict(list)
@@ -69,6 +75,11 @@ def build_char_and_reverse_dict(unique_hanja_chars):
         if char_data:
             char_dict[char] = char_data
 
+        # needed for the "훈 음" korean_gloss the serving index emits
+        hun = extract_korean_hun(soup)
+        if hun:
+            char_dict.setdefault(char, {"pinyin": "", "meaning": ""})["hun"] = hun
+
         # Reverse Hangul lookup
         hangul_readings = extract_korean_readings(soup)
         for reading in hangul_readings:
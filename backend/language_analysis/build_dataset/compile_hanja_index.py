@@ -0,0 +1,127 @@
+import os
+import json
+import argparse
+
+from backend.language_analysis.hanja_dictionary import (
+    HANJA_INDEX_PATH,
+    write_hanja_index,
+)
+
+### === Compile word-level Hanja data into the serving lookup index ===
+#
+# The index is consulted before the word store and GPT, so only word-level Hanja
+# spellings are trusted. Nothing in this directory produces them: --word-hanja takes
+# a {word: hanja} JSON converted from a dictionary export that records each word's
+# original spelling (e.g. the 원어 field of 우리말샘 / 표준국어대사전 downloads).
+# Without it an empty index is written and every word falls through to GPT.
+#
+# --enriched-dict (build_hanja_dataset.py's syllable-by-syllable guesses) is
+# experimental: a native word whose syllables each have one candidate character
+# still gets a made-up spelling.
+#
+# Run from the repo root; the inputs default to the files the scrapers write here:
+#   python -m backend.language_analysis.build_dataset.compile_hanja_index --word-hanja word_hanja.json
+
+
+def is_hangul(char: str) -> bool:
+    return "가" <= char <= "힣"
+
+
+def build_index_entry(word, hanja_word, char_dict, reverse_dict):
+    """
+    Convert one word's Hanja spelling into the same shape `hanja_batcher` gets from GPT.
+    Words that don't check out are skipped (GPT stays the fallback).
+    """
+    if len(hanja_word) != len(word) or any(is_hangul(ch) for ch in hanja_word):
+        return None
+
+    characters = []
+    seen = set()
+    for syllable, char in zip(word, hanja_word):
+        # the spelling comes from the word source; readings come from the character data
+        if char not in reverse_dict.get(syllable, []):
+            return None
+        if char in seen:
+            continue
+        seen.add(char)
+
+        char_data = char_dict.get(char, {})
+        # GPT glosses characters as "훈 음" (e.g. "멀 유"); without the hun, leave it to GPT
+        if not char_data.get("hun"):
+            return None
+        characters.append(
+            {
+                "char": char,
+                "korean_gloss": f"{char_data['hun']} {syllable}",
+                "pinyin": char_data.get("pinyin", ""),
+                "english_gloss": char_data.get("meaning", ""),
+            }
+        )
+
+    return {"korean": word, "hanja": hanja_word, "characters": characters}
+
+
+def unambiguous_guess(word, enriched_entry, reverse_dict):
+    """
+    build_hanja_dataset picks the first candidate character per syllable, so its
+    spelling is only a real answer when no syllable had another candidate.
+    """
+    if any(len(reverse_dict.get(syllable, [])) != 1 for syllable in word):
+        return None
+    return enriched_entry.get("hanja", "")
+
+
+def compile_index(word_hanja, char_dict, reverse_dict, enriched_dict=None):
+    spellings = {}
+    for word, enriched_entry in (enriched_dict or {}).items():
+        hanja_word = unambiguous_guess(word, enriched_entry, reverse_dict)
+        if hanja_word:
+            spellings[word] = hanja_word
+    # word-level spellings win over syllable guesses
+    spellings.update(word_hanja)
+
+    entries = {}
+    for word, hanja_word in spellings.items():
+        entry = build_index_entry(word, hanja_word, char_dict, reverse_dict)
+        if entry:
+            entries[word] = entry
+    return entries
+
+
+### === MAIN ===
+
+if __name__ == "__main__":
+    dataset_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--char-dict", default=os.path.join(dataset_dir, "hanja_char_dict.json"))
+    parser.add_argument("--reverse-dict", default=os.path.join(dataset_dir, "hangul_to_hanja.json"))
+    parser.add_argument(
+        "--word-hanja", help="word-level {word: hanja} spellings from a dictionary export"
+    )
+    parser.add_argument(
+        "--enriched-dict",
+        help="experimental: also index syllable guesses from build_hanja_dataset.py",
+    )
+    parser.add_argument("--output", default=HANJA_INDEX_PATH)
+    args = parser.parse_args()
+
+    with open(args.char_dict, encoding="utf-8") as f:
+        hanja_char_dict = json.load(f)
+    with open(args.reverse_dict, encoding="utf-8") as f:
+        hangul_to_hanja = json.load(f)
+    word_hanja = {}
+    if args.word_hanja:
+        with open(args.word_hanja, encoding="utf-8") as f:
+            word_hanja = json.load(f)
+    else:
+        print("⚠️ No --word-hanja given; the index will only hold --enriched-dict guesses, if any")
+    enriched_dict = None
+    if args.enriched_dict:
+        with open(args.enriched_dict, encoding="utf-8") as f:
+            enriched_dict = json.load(f)
+
+    index_entries = compile_index(word_hanja, hanja_char_dict, hangul_to_hanja, enriched_dict)
+    write_hanja_index(index_entries, args.output)
+
+    total = len(word_hanja) + len(enriched_dict or {})
+    print(f"📁 Saved {len(index_entries)} of {total} candidate words to {args.output}")
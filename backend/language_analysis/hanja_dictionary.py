@@ -0,0 +1,124 @@
+import os
+import json
+import mmap
+import struct
+import threading
+
+# -----------------------------------------------------------------------------
+# Compiled Hanja lookup artifact (built by build_dataset/compile_hanja_index.py)
+#
+# Layout (little-endian):
+#   MAGIC | count:u32 | offsets:(count + 1) * u32 | records
+#   record = key_len:u16 | key (utf-8) | value (utf-8 JSON)
+# Records are sorted by key bytes, so lookups binary-search the mmapped file
+# without loading it into memory.
+# -----------------------------------------------------------------------------
+
+MAGIC = b"KOEXHJ1\0"
+HEADER = struct.Struct("<I")
+OFFSET = struct.Struct("<I")
+KEY_LEN = struct.Struct("<H")
+
+HANJA_INDEX_PATH = os.getenv(
+    "HANJA_INDEX_PATH",
+    os.path.join(os.path.dirname(__file__), "build_dataset", "hanja_index.bin"),
+)
+
+
+def write_hanja_index(entries: dict[str, dict], path: str) -> None:
+    records = []
+    for word in sorted(entries, key=lambda w: w.encode("utf-8")):
+        key = word.encode("utf-8")
+        value = json.dumps(entries[word], ensure_ascii=False).encode("utf-8")
+        records.append(KEY_LEN.pack(len(key)) + key + value)
+
+    offsets = [0]
+    for record in records:
+        offsets.append(offsets[-1] + len(record))
+
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(HEADER.pack(len(records)))
+        for offset in offsets:
+            f.write(OFFSET.pack(offset))
+        for record in records:
+            f.write(record)
+
+
+class HanjaIndex:
+    def __init__(self, path: str):
+        self.path = path
+        self._mm = None
+        self._count = 0
+        self._data_start = 0
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> None:
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+
+            if not os.path.exists(self.path):
+                return
+
+            with open(self.path, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            if mm[: len(MAGIC)] != MAGIC:
+                print(f"⚠️ Ignoring Hanja index with unknown format: {self.path}")
+                mm.close()
+                return
+
+            (self._count,) = HEADER.unpack_from(mm, len(MAGIC))
+            self._data_start = len(MAGIC) + HEADER.size + (self._count + 1) * OFFSET.size
+            self._mm = mm
+
+    def _record_bounds(self, i: int) -> tuple[int, int]:
+        table = len(MAGIC) + HEADER.size
+        (start,) = OFFSET.unpack_from(self._mm, table + i * OFFSET.size)
+        (end,) = OFFSET.unpack_from(self._mm, table + (i + 1) * OFFSET.size)
+        return self._data_start + start, self._data_start + end
+
+    def _key_at(self, i: int) -> tuple[bytes, int, int]:
+        start, end = self._record_bounds(i)
+        (key_len,) = KEY_LEN.unpack_from(self._mm, start)
+        key_start = start + KEY_LEN.size
+        return self._mm[key_start : key_start + key_len], key_start + key_len, end
+
+    def lookup(self, word: str) -> dict | None:
+        if not self._loaded:
+            self._load()
+        if self._mm is None:
+            return None
+
+        target = word.encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            key, value_start, value_end = self._key_at(mid)
+            if key == target:
+                return json.loads(self._mm[value_start:value_end])
+            if key < target:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        return None
+
+    def lookup_many(self, words: list[str]) -> dict[str, dict]:
+        found = {}
+        for word in words:
+            entry = self.lookup(word)
+            if entry is not None:
+                found[word] = entry
+        return found
+
+    def __len__(self) -> int:
+        if not self._loaded:
+            self._load()
+        return self._count
+
+
+hanja_index = HanjaIndex(HANJA_INDEX_PATH)
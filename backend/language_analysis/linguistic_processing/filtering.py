@@ -1,16 +1,33 @@
-import os
+import asyncio
 
 from konlpy.tag import Komoran
 
+from backend.gpt.config import FUSED_PREPROCESSING
+from backend.gpt.fused_preprocessor import (
+    normalize_spacing_and_detect_idioms,
+    normalize_spacing_and_detect_idioms_many,
+)
 from backend.gpt.spacing_normalizer import normalize_korean_spacing
 from backend.language_analysis.linguistic_processing.grouping import group_komoran_tokens
+from backend.language_analysis.linguistic_processing.komoran_cache import (
+    KOMORAN_CACHE_ENABLED,
+    komoran_cache,
+)
+from backend.language_analysis.linguistic_processing.komoran_pool import (
+    USER_DIC_PATH,
+    bulk_pos,
+    komoran_pool,
+)
 from backend.language_analysis.linguistic_processing.preprocessing import (
     preprocess_text,
+    replace_idiom_spans_with_placeholders,
     replace_sajaseongeo_with_placeholders,
 )
 from backend.language_analysis.linguistic_processing.rule_matcher import (
     merge_aux_grammar_chunks,
 )
+from backend.metrics import STAGE_LATENCY
+from backend.tracing import trace_event
 
 EXCLUDE_TOKENS = {
     # Particles
@@ -52,40 +69,131 @@ ALLOWED_POS = {
     "MM",
 }
 
-current_dir = os.path.dirname(__file__)
-user_dic_path = os.path.join(current_dir, "user.dic")
-komoran = Komoran(userdic=user_dic_path)
+user_dic_path = USER_DIC_PATH
+_komoran = None
+
 
+def get_komoran() -> Komoran:
+    # started on first use, so importing this module doesn't boot the JVM
+    global _komoran
+    if _komoran is None:
+        _komoran = Komoran(userdic=user_dic_path)
+    return _komoran
 
-def filter_korean_tokens(text: str) -> list[tuple[str, str]]:
+
+async def filter_korean_tokens(text: str) -> list[tuple[str, str]]:
     """Run the full Korean token filtering pipeline."""
-    text_with_placeholders, placeholder_map = prepare_text_for_tokenization(text)
-    tagged_text = tokenize_text(text_with_placeholders)
+    text_with_placeholders, placeholder_map = await prepare_text_for_tokenization(text)
+    tagged_text = await tokenize_text_async(text_with_placeholders)
     grouped_tokens = apply_grouping_pipeline(tagged_text)
     return filter_allowed_tokens(grouped_tokens, placeholder_map)
 
 
-def prepare_text_for_tokenization(text: str) -> tuple[str, dict[str, str]]:
+async def prepare_text_for_tokenization(text: str) -> tuple[str, dict[str, str]]:
     preprocessed_text = preprocess_text(text)
-    spaced_text = normalize_korean_spacing(preprocessed_text)
-    return replace_sajaseongeo_with_placeholders(spaced_text)
+
+    if FUSED_PREPROCESSING:
+        fused = await normalize_spacing_and_detect_idioms(preprocessed_text)
+        if fused is not None:
+            spaced_text, idiom_spans = fused
+            return replace_idiom_spans_with_placeholders(spaced_text, idiom_spans)
+
+    # fall back to separate spacing + idiom calls
+    spaced_text = await normalize_korean_spacing(preprocessed_text)
+    return await replace_sajaseongeo_with_placeholders(spaced_text)
+
+
+async def filter_korean_tokens_many(texts: list[str]) -> list[list[tuple[str, str]]]:
+    """Batched variant of `filter_korean_tokens` for many sentences at once."""
+    prepared = await prepare_texts_for_tokenization(texts)
+    tagged_texts = await tokenize_many_async([text for text, _ in prepared])
+    return [
+        filter_allowed_tokens(apply_grouping_pipeline(tagged_text), placeholder_map)
+        for tagged_text, (_, placeholder_map) in zip(tagged_texts, prepared)
+    ]
+
+
+async def prepare_texts_for_tokenization(
+    texts: list[str],
+) -> list[tuple[str, dict[str, str]]]:
+    """Spacing + idiom detection for many sentences with one GPT call per batch."""
+    preprocessed_texts = [preprocess_text(text) for text in texts]
+
+    fused_results = [None] * len(texts)
+    if FUSED_PREPROCESSING:
+        fused_results = await normalize_spacing_and_detect_idioms_many(
+            preprocessed_texts
+        )
+
+    async def prepare(text: str, fused) -> tuple[str, dict[str, str]]:
+        if fused is not None:
+            return replace_idiom_spans_with_placeholders(*fused)
+        return await prepare_text_for_tokenization(text)
+
+    return await asyncio.gather(
+        *(prepare(text, fused) for text, fused in zip(texts, fused_results))
+    )
+
+
+def tag_units(units: list[str]) -> list[list[tuple[str, str]]]:
+    # sentences, or eojeols with KOMORAN_EOJEOL_CACHE_ENABLED
+    return bulk_pos(get_komoran(), units)
 
 
 def tokenize_text(text: str) -> list[tuple[str, str]]:
-    tagged_text = komoran.pos(text)
-    print(f"{tagged_text=}")
+    with STAGE_LATENCY.time(stage="komoran_pos"):
+        if KOMORAN_CACHE_ENABLED:
+            tagged_text = komoran_cache.tag_many([text], tag_units)[0]
+        else:
+            tagged_text = get_komoran().pos(text)
+    trace_event("tagged_text", tagged_text)
+    return tagged_text
+
+
+async def tokenize_text_async(text: str) -> list[tuple[str, str]]:
+    """`tokenize_text` on the worker pool when KOMORAN_WORKERS > 0."""
+    if not komoran_pool.enabled:
+        return tokenize_text(text)
+
+    with STAGE_LATENCY.time(stage="komoran_pos"):
+        if KOMORAN_CACHE_ENABLED:
+            tagged_text = (await komoran_cache.atag_many([text], komoran_pool.pos_many))[0]
+        else:
+            tagged_text = await komoran_pool.pos(text)
+    trace_event("tagged_text", tagged_text)
     return tagged_text
 
 
+def tokenize_many(texts: list[str]) -> list[list[tuple[str, str]]]:
+    """Tag many texts, reading each analysis back as one string rather than per token."""
+    with STAGE_LATENCY.time(stage="komoran_pos_many"):
+        if KOMORAN_CACHE_ENABLED:
+            return komoran_cache.tag_many(texts, tag_units)
+        return bulk_pos(get_komoran(), texts)
+
+
+async def tokenize_many_async(texts: list[str]) -> list[list[tuple[str, str]]]:
+    """`tokenize_many`, split across the worker pool when KOMORAN_WORKERS > 0."""
+    if not komoran_pool.enabled:
+        return tokenize_many(texts)
+
+    with STAGE_LATENCY.time(stage="komoran_pos_many"):
+        if KOMORAN_CACHE_ENABLED:
+            return await komoran_cache.atag_many(texts, komoran_pool.pos_many)
+        return await komoran_pool.pos_many(texts)
+
+
 def apply_grouping_pipeline(
     tagged_tokens: list[tuple[str, str]]
 ) -> list[tuple[str, str]]:
     """Apply structural token grouping before final filtering."""
-    merged_tokens = merge_aux_grammar_chunks(tagged_tokens)
-    print(f"merged_chunks={merged_tokens}")
+    with STAGE_LATENCY.time(stage="grammar_merge"):
+        merged_tokens = merge_aux_grammar_chunks(tagged_tokens)
+    trace_event("merged_chunks", merged_tokens)
 
-    grouped_tokens = group_komoran_tokens(merged_tokens)
-    print(f"{grouped_tokens=}")
+    with STAGE_LATENCY.time(stage="grouping"):
+        grouped_tokens = group_komoran_tokens(merged_tokens)
+    trace_event("grouped_tokens", grouped_tokens)
     return grouped_tokens
 
 
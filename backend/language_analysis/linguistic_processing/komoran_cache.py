@@ -0,0 +1,132 @@
+import os
+import threading
+from collections import OrderedDict
+
+from backend.metrics import KOMORAN_CACHE_LOOKUPS
+
+# Whole sentences are memoized, for repeated lines and re-analysis of the same transcript.
+# Subtitles also repeat the same eojeol (그래서, 있어요, 하는데) constantly, so Komoran output
+# can additionally be memoized per eojeol, sending only unseen eojeols to the JVM. That is
+# opt-in: tagged on their own, eojeols lose Komoran's multi-eojeol dictionary entries
+# ("로드 스튜어트", "4월 9일", "대량 생산"), which changed the filtered tokens of 11 of the
+# 214 benchmark corpus sentences.
+KOMORAN_CACHE_ENABLED = os.getenv("KOMORAN_CACHE_ENABLED", "1") == "1"
+KOMORAN_EOJEOL_CACHE_ENABLED = os.getenv("KOMORAN_EOJEOL_CACHE_ENABLED", "0") == "1"
+KOMORAN_EOJEOL_CACHE_SIZE = int(os.getenv("KOMORAN_EOJEOL_CACHE_SIZE", "50000"))
+KOMORAN_SENTENCE_CACHE_SIZE = int(os.getenv("KOMORAN_SENTENCE_CACHE_SIZE", "5000"))
+
+Tagged = list[tuple[str, str]]
+
+
+class LRUMemo:
+    """Bounded, thread-safe LRU map with hit/miss counters."""
+
+    def __init__(self, name: str, max_entries: int):
+        self.name = name
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> tuple | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        KOMORAN_CACHE_LOOKUPS.inc(level=self.name, outcome="miss" if value is None else "hit")
+        return value
+
+    def set(self, key: str, value: tuple) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class KomoranCache:
+    """
+    Sentence-level memo in front of Komoran, plus an eojeol-level one when
+    `split_eojeols` is set. Callers pass the function that tags a batch of unseen
+    units, i.e. sentences or eojeols (in-process `bulk_pos` or the worker pool).
+
+    Split eojeols are tagged on their own rather than in sentence context, so
+    multi-eojeol dictionary entries are never found and some analyses differ from
+    tagging the full sentence.
+    """
+
+    def __init__(self, eojeol_size: int, sentence_size: int, split_eojeols: bool = False):
+        self.eojeols = LRUMemo("eojeol", eojeol_size)
+        self.sentences = LRUMemo("sentence", sentence_size)
+        self.split_eojeols = split_eojeols
+
+    def units(self, text: str) -> list[str]:
+        eojeols = text.split()
+        return eojeols if self.split_eojeols else [" ".join(eojeols)]
+
+    def plan(self, texts: list[str]) -> tuple[list[tuple | None], dict[str, tuple], list[str]]:
+        """Cached sentences (None on a miss), cached units they need, and unseen units."""
+        sentence_hits = [self.sentences.get(" ".join(text.split())) for text in texts]
+
+        known: dict[str, tuple] = {}
+        unseen: dict[str, None] = {}  # ordered set
+        for text, hit in zip(texts, sentence_hits):
+            if hit is not None:
+                continue
+            for unit in self.units(text):
+                if unit in known or unit in unseen:
+                    continue
+                tagged = self.eojeols.get(unit) if self.split_eojeols else None
+                if tagged is None:
+                    unseen[unit] = None
+                else:
+                    known[unit] = tagged
+        return sentence_hits, known, list(unseen)
+
+    def complete(
+        self,
+        texts: list[str],
+        sentence_hits: list[tuple | None],
+        known: dict[str, tuple],
+        unseen: list[str],
+        tagged_unseen: list[Tagged],
+    ) -> list[Tagged]:
+        """Splice cached and freshly tagged units back into per-text results."""
+        for unit, tagged in zip(unseen, tagged_unseen):
+            known[unit] = tuple(tagged)
+            if self.split_eojeols:
+                self.eojeols.set(unit, known[unit])
+
+        results = []
+        for text, hit in zip(texts, sentence_hits):
+            if hit is None:
+                hit = tuple(morpheme for unit in self.units(text) for morpheme in known[unit])
+                self.sentences.set(" ".join(text.split()), hit)
+            results.append(list(hit))
+        return results
+
+    def tag_many(self, texts: list[str], tag_units) -> list[Tagged]:
+        sentence_hits, known, unseen = self.plan(texts)
+        tagged_unseen = tag_units(unseen) if unseen else []
+        return self.complete(texts, sentence_hits, known, unseen, tagged_unseen)
+
+    async def atag_many(self, texts: list[str], tag_units) -> list[Tagged]:
+        sentence_hits, known, unseen = self.plan(texts)
+        tagged_unseen = await tag_units(unseen) if unseen else []
+        return self.complete(texts, sentence_hits, known, unseen, tagged_unseen)
+
+    def stats(self) -> dict:
+        return {"eojeol": self.eojeols.stats(), "sentence": self.sentences.stats()}
+
+
+komoran_cache = KomoranCache(
+    KOMORAN_EOJEOL_CACHE_SIZE, KOMORAN_SENTENCE_CACHE_SIZE, KOMORAN_EOJEOL_CACHE_ENABLED
+)
@@ -0,0 +1,231 @@
+import os
+import re
+import signal
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from konlpy.tag import Komoran
+
+from backend.metrics import KOMORAN_POOL_RESTARTS
+
+# Worker processes each holding a warm JVM + Komoran, so tokenization scales with
+# cores instead of serializing on the single in-process JVM. 0 keeps the in-process path.
+KOMORAN_WORKERS = int(os.getenv("KOMORAN_WORKERS", "0"))
+KOMORAN_TASK_TIMEOUT = float(os.getenv("KOMORAN_TASK_TIMEOUT", "30"))
+# spawning the workers and booting their JVMs takes far longer than a task
+KOMORAN_WARMUP_TIMEOUT = float(os.getenv("KOMORAN_WARMUP_TIMEOUT", "120"))
+# seconds between pool health probes; 0 disables them
+KOMORAN_HEALTH_INTERVAL = float(os.getenv("KOMORAN_HEALTH_INTERVAL", "60"))
+
+USER_DIC_PATH = os.path.join(os.path.dirname(__file__), "user.dic")
+PROBE_SENTENCE = "확인"
+
+# one "morph/TAG" of getPlainText(); morphs may themselves contain "/" or "+"
+PLAIN_TEXT_MORPHEME = re.compile(r"(.+)/([A-Z]{2,3})")
+# getPlainText() spells unknown (NA) morphs out as decomposed jamo, and user-dictionary
+# entries may contain spaces, so those analyses have to be read token by token
+PLAIN_TEXT_UNSAFE_TAGS = {"NA"}
+
+# set in each worker process by `init_worker`
+_worker_komoran = None
+_worker_barrier = None
+
+
+def init_worker(user_dic_path: str, worker_pids, barrier) -> None:
+    global _worker_komoran, _worker_barrier
+    _worker_komoran = Komoran(userdic=user_dic_path)
+    _worker_barrier = barrier
+    # report in, so the parent can kill this worker even if its JVM hangs
+    with worker_pids.get_lock():
+        slot = list(worker_pids).index(0)
+        worker_pids[slot] = os.getpid()
+
+
+def parse_plain_text(plain_text: str) -> list[tuple[str, str]] | None:
+    """Morphemes of a getPlainText() string, or None if it can't be read back losslessly."""
+    tagged = []
+    for morpheme in plain_text.split(" ") if plain_text else []:
+        match = PLAIN_TEXT_MORPHEME.fullmatch(morpheme)
+        if match is None or match.group(2) in PLAIN_TEXT_UNSAFE_TAGS:
+            return None
+        tagged.append((match.group(1), match.group(2)))
+    return tagged
+
+
+def plain_text_pos(komoran: Komoran, text: str) -> list[tuple[str, str]]:
+    """
+    Same result as `komoran.pos(text)`, but each line's analysis comes back from the
+    JVM as one plain-text string instead of two JPype calls per token. Lines whose
+    string can't be split back exactly are read token by token.
+    """
+    tagged: list[tuple[str, str]] = []
+    for line in text.split("\n"):
+        if not line:
+            continue
+        result = komoran.jki.analyze(line)
+        morphemes = parse_plain_text(str(result.getPlainText()))
+        if morphemes is None:
+            morphemes = [(str(token.getMorph()), str(token.getPos())) for token in result.getTokenList()]
+        tagged.extend(morphemes)
+    return tagged
+
+
+def bulk_pos(komoran: Komoran, texts: list[str]) -> list[list[tuple[str, str]]]:
+    """
+    Tag many texts through `plain_text_pos`. Texts are still analyzed one by one:
+    joining them into a single `analyze` call was measured slower on the corpus,
+    and lets tagging leak across text boundaries.
+    """
+    return [plain_text_pos(komoran, text) for text in texts]
+
+
+def pos_in_worker(text: str) -> list[tuple[str, str]]:
+    # plain tuples: JPype-backed results can't be pickled back to the parent
+    return [(token, tag) for token, tag in _worker_komoran.pos(text)]
+
+
+def pos_many_in_worker(texts: list[str]) -> list[list[tuple[str, str]]]:
+    return bulk_pos(_worker_komoran, texts)
+
+
+def probe_worker(timeout: float) -> int:
+    _worker_komoran.pos(PROBE_SENTENCE)
+    # a worker holding this task can't take another, so N probes reach N workers
+    _worker_barrier.wait(timeout)
+    return os.getpid()
+
+
+class KomoranPool:
+    def __init__(self, workers: int, user_dic_path: str = USER_DIC_PATH):
+        self.workers = workers
+        self.user_dic_path = user_dic_path
+        self.restarts = 0
+        self._executor: ProcessPoolExecutor | None = None
+        self._worker_pids = None
+        self._health_task: asyncio.Task | None = None
+        self._warm_up_task: asyncio.Task | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn, not fork: a forked child would inherit the event loop and any JVM state
+            context = multiprocessing.get_context("spawn")
+            self._worker_pids = context.Array("i", self.workers)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=context,
+                initializer=init_worker,
+                initargs=(self.user_dic_path, self._worker_pids, context.Barrier(self.workers)),
+            )
+        return self._executor
+
+    def restart(self) -> None:
+        executor, self._executor = self._executor, None
+        self.restarts += 1
+        KOMORAN_POOL_RESTARTS.inc()
+        if executor is not None:
+            # a hung JVM never returns, so kill the workers rather than wait on them
+            for pid in self._worker_pids:
+                if pid:
+                    try:
+                        os.kill(pid, signal.SIGTERM)
+                    except ProcessLookupError:
+                        pass
+            executor.shutdown(wait=False, cancel_futures=True)
+        print(f"⚠️ Restarted Komoran worker pool (restart #{self.restarts})")
+        # boot the replacement now; the retried request waits for it in `_submit`
+        self._start_warm_up()
+
+    async def _submit(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            await self._wait_for_warm_up()
+            executor = self._get_executor()
+            try:
+                return await asyncio.wait_for(
+                    loop.run_in_executor(executor, fn, *args), KOMORAN_TASK_TIMEOUT
+                )
+            except (BrokenProcessPool, asyncio.TimeoutError):
+                # a worker died or hung: replace the pool once, then retry
+                if self._executor is executor:
+                    self.restart()
+                if attempt:
+                    raise
+
+    async def pos(self, text: str) -> list[tuple[str, str]]:
+        return await self._submit(pos_in_worker, text)
+
+    async def pos_many(self, texts: list[str]) -> list[list[tuple[str, str]]]:
+        # one batch per worker
+        size = -(-len(texts) // self.workers) or 1
+        batches = [texts[i:i + size] for i in range(0, len(texts), size)]
+        results = await asyncio.gather(*(self._submit(pos_many_in_worker, b) for b in batches))
+        return [tagged for batch in results for tagged in batch]
+
+    async def _probe_all(self, executor: ProcessPoolExecutor, timeout: float) -> bool:
+        """Whether every worker of `executor` tags the probe sentence within `timeout`."""
+        loop = asyncio.get_running_loop()
+        try:
+            probes = [
+                loop.run_in_executor(executor, probe_worker, timeout) for _ in range(self.workers)
+            ]
+            pids = await asyncio.wait_for(asyncio.gather(*probes), timeout)
+        except Exception:
+            return False
+        return len(set(pids)) == self.workers
+
+    async def _warm_up(self, executor: ProcessPoolExecutor) -> None:
+        if not await self._probe_all(executor, KOMORAN_WARMUP_TIMEOUT):
+            print("⚠️ Komoran workers did not all warm up; requests will retry on a new pool")
+
+    def _start_warm_up(self) -> None:
+        self._warm_up_task = asyncio.create_task(self._warm_up(self._get_executor()))
+
+    async def _wait_for_warm_up(self) -> None:
+        if self._warm_up_task is not None:
+            # shielded: a cancelled request must not cancel the warm-up others wait on
+            await asyncio.shield(self._warm_up_task)
+
+    async def warm_up(self) -> None:
+        """Start every worker's JVM now rather than on the first requests."""
+        self._start_warm_up()
+        await self._wait_for_warm_up()
+
+    async def check_health(self) -> bool:
+        """Probe every worker of the current pool, without `_submit`'s restart-and-retry."""
+        await self._wait_for_warm_up()
+        return await self._probe_all(self._get_executor(), KOMORAN_TASK_TIMEOUT)
+
+    async def _monitor_health(self) -> None:
+        while True:
+            await asyncio.sleep(KOMORAN_HEALTH_INTERVAL)
+            executor = self._executor
+            if executor is None or await self.check_health():
+                continue
+            # a request may already have replaced the pool while the probe ran
+            if self._executor is executor:
+                print("⚠️ Komoran worker pool failed its health check")
+                self.restart()
+
+    def start_health_checks(self) -> None:
+        if KOMORAN_HEALTH_INTERVAL > 0 and self._health_task is None:
+            self._health_task = asyncio.create_task(self._monitor_health())
+
+    def shutdown(self) -> None:
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+        if self._warm_up_task is not None:
+            self._warm_up_task.cancel()
+            self._warm_up_task = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+komoran_pool = KomoranPool(KOMORAN_WORKERS)
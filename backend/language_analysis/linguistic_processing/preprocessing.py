@@ -15,8 +15,8 @@ def generate_placeholder(idx: int) -> str:
 
 
 # detect idioms and replace them with safe placeholders
-def replace_sajaseongeo_with_placeholders(text: str) -> tuple[str, dict]:
-    idioms = set(detect_idioms(text))  # de-duplicate
+async def replace_sajaseongeo_with_placeholders(text: str) -> tuple[str, dict]:
+    idioms = set(await detect_idioms(text) or [])  # de-duplicate
     placeholder_map = {}
 
     for idx, phrase in enumerate(idioms):
@@ -30,3 +30,29 @@ def replace_sajaseongeo_with_placeholders(text: str) -> tuple[str, dict]:
             placeholder_map[placeholder] = phrase
 
     return text, placeholder_map
+
+
+# replace pre-located idiom spans (plus any attached suffix) with placeholders
+def replace_idiom_spans_with_placeholders(
+    text: str, spans: list[tuple[int, int, str]]
+) -> tuple[str, dict]:
+    placeholder_map = {}
+    pieces = []
+    cursor = 0
+
+    for idx, (start, end, phrase) in enumerate(spans):
+        if start < cursor:
+            continue
+
+        # swallow the suffix glued to the idiom, same as the `\S*` in the regex path
+        while end < len(text) and not text[end].isspace():
+            end += 1
+
+        placeholder = generate_placeholder(idx)
+        pieces.append(text[cursor:start])
+        pieces.append(placeholder)
+        placeholder_map[placeholder] = phrase
+        cursor = end
+
+    pieces.append(text[cursor:])
+    return "".join(pieces), placeholder_map
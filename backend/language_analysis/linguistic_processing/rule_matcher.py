@@ -20,6 +20,43 @@ TAG_EQUIVALENTS = {
 }
 
 
+class RuleTrieNode:
+    __slots__ = ("edges", "rule_index")
+
+    def __init__(self):
+        # (tag or None, token or None) -> child; None matches anything
+        self.edges: dict[tuple[str | None, str | None], RuleTrieNode] = {}
+        # earliest rule whose pattern ends here, so ties keep YAML order
+        self.rule_index: int | None = None
+
+
+def expand_condition(cond: dict) -> list[tuple[str | None, str | None]]:
+    """Edge keys for one pattern step, with TAG_EQUIVALENTS expanded to actual tags."""
+    token = cond.get("token")
+    if "tag" not in cond:
+        return [(None, token)]
+    return [(tag, token) for tag in sorted(TAG_EQUIVALENTS.get(cond["tag"], {cond["tag"]}))]
+
+
+def compile_rules(rules: list[dict]) -> RuleTrieNode:
+    """Compile rule patterns into a trie over (tag, token), one path per tag expansion."""
+    root = RuleTrieNode()
+    for index, rule in enumerate(rules):
+        nodes = [root]
+        for cond in rule["pattern"]:
+            keys = expand_condition(cond)
+            nodes = [
+                node.edges.setdefault(key, RuleTrieNode()) for node in nodes for key in keys
+            ]
+        for node in nodes:
+            if node.rule_index is None or index < node.rule_index:
+                node.rule_index = index
+    return root
+
+
+RULE_TRIE = compile_rules(GRAMMAR_RULES)
+
+
 def merge_aux_grammar_chunks(tagged: list[tuple[str, str]]) -> list[tuple[str, str]]:
     """
     Merge morpheme sequences based on loaded grammar rules.
@@ -44,20 +81,32 @@ def merge_aux_grammar_chunks(tagged: list[tuple[str, str]]) -> list[tuple[str, s
 def find_best_rule_match(
     tagged: list[tuple[str, str]], start_index: int
 ) -> tuple[tuple[str, str] | None, int]:
-    best_match = None
+    """
+    Walk RULE_TRIE from `start_index`, following every edge the next morpheme satisfies.
+    The longest match wins, ties go to the earlier rule, and only the winner is contracted.
+    """
+    best_index = None
     best_len = 0
 
-    for rule in GRAMMAR_RULES:
-        result = match_rule(tagged, start_index, rule)
-        if not result:
-            continue
-
-        rule_len = len(rule["pattern"])
-        if rule_len > best_len:
-            best_match = result
-            best_len = rule_len
-
-    return best_match, best_len
+    nodes = [RULE_TRIE]
+    position = start_index
+    while nodes and position < len(tagged):
+        token, tag = tagged[position]
+        keys = ((tag, token), (tag, None), (None, token), (None, None))
+        nodes = [node.edges[key] for node in nodes for key in keys if key in node.edges]
+        position += 1
+
+        ended = [node.rule_index for node in nodes if node.rule_index is not None]
+        if ended:
+            best_index = min(ended)
+            best_len = position - start_index
+
+    if best_index is None:
+        return None, 0
+
+    rule = GRAMMAR_RULES[best_index]
+    matched_tokens = [token for token, _ in tagged[start_index:start_index + best_len]]
+    return (contract_korean(matched_tokens), rule.get("group_as", "VV")), best_len
 
 
 def tag_matches(expected: str, actual: str) -> bool:
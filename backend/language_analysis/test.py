@@ -1,8 +1,16 @@
+import random
+
 from backend.language_analysis.linguistic_processing.grouping import group_komoran_tokens
 from backend.language_analysis.linguistic_processing.filtering import (
     is_allowed_content_token,
 )
-from backend.language_analysis.linguistic_processing.rule_matcher import merge_aux_grammar_chunks
+from backend.language_analysis.linguistic_processing.rule_matcher import (
+    GRAMMAR_RULES,
+    TAG_EQUIVALENTS,
+    find_best_rule_match,
+    match_rule,
+    merge_aux_grammar_chunks,
+)
 from backend.language_analysis.word_extraction import (
     extract_candidate_korean_words,
     tag_if_derived_by_substring,
@@ -39,6 +47,38 @@ def test_derived_tags_preserve_order(entries: list[str], expected: list[dict]):
     print(f"✅ Passed derived tagging order: {entries}")
 
 
+def linear_rule_match(tagged: list[tuple[str, str]], start_index: int):
+    # the rule-by-rule scan the trie replaced: longest match wins, ties keep YAML order
+    best_match, best_len = None, 0
+    for rule in GRAMMAR_RULES:
+        result = match_rule(tagged, start_index, rule)
+        if result and len(rule["pattern"]) > best_len:
+            best_match, best_len = result, len(rule["pattern"])
+    return best_match, best_len
+
+
+def test_trie_matches_linear_scan(samples: int, seed: int = 0):
+    # draw morphemes from the rules themselves so random sequences actually hit them
+    tokens = {"가", "먹"}
+    tags = {"NNG", "VV", "EC", "EF", "JKO"}
+    for rule in GRAMMAR_RULES:
+        for cond in rule["pattern"]:
+            tokens.add(cond.get("token", "x"))
+            tags |= TAG_EQUIVALENTS.get(cond.get("tag"), {cond.get("tag", "NNG")})
+    tokens, tags = sorted(tokens), sorted(tags)
+
+    rng = random.Random(seed)
+    for _ in range(samples):
+        tagged = [(rng.choice(tokens), rng.choice(tags)) for _ in range(rng.randint(1, 12))]
+        for start_index in range(len(tagged)):
+            expected = linear_rule_match(tagged, start_index)
+            result = find_best_rule_match(tagged, start_index)
+
+            assert result == expected, f"\nInput:    {tagged}[{start_index}:]\nExpected: {expected}\nGot:      {result}"
+
+    print(f"✅ Passed trie vs. linear rule scan: {samples} random sequences")
+
+
 def test_excluded_token(token: str, tag: str):
     assert not is_allowed_content_token(token, tag), f"Expected {token}/{tag} to be excluded"
 
@@ -113,6 +153,8 @@ if __name__ == "__main__":
         ['공부', '공부하지', '않으려고했어요'],
     )
 
+    test_trie_matches_linear_scan(5000)
+
     test_extract([("초라", "XR"), ("하다", "VV")], ["초라", "하다"])
     test_derived_tags_preserve_order(
         ["빛내어", "빛", "이루고", "이루"],
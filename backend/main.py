@@ -1,22 +1,13 @@
-import json
-import asyncio
-
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-
-from backend.gpt.hanja_batcher import generate_hanja_for_words
-from backend.gpt.korean_analyzer import analyze_korean_sentence
+from fastapi.responses import PlainTextResponse, StreamingResponse
 
-from backend.language_analysis.linguistic_processing.filtering import (
-    filter_korean_tokens,
-)
-from backend.language_analysis.word_extraction import (
-    extract_candidate_korean_words,
-    tag_if_derived_by_substring,
-)
+from backend.analysis import analysis_api
+from backend.analysis.preanalysis import analyze_with_preanalysis
+from backend.language_analysis.linguistic_processing.komoran_pool import komoran_pool
 
-from backend.language_analysis.romanizer import romanize
+from backend.metrics import render_metrics
+from backend.tracing import DEBUG_TRACES_ENABLED, TraceMiddleware, get_recent_traces
 
 from backend.vector import search_api
 from backend.transcripts import transcript_api
@@ -30,109 +21,39 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Debug-Trace-Id"],
 )
+app.add_middleware(TraceMiddleware)
 
+app.include_router(analysis_api.router)
 app.include_router(search_api.router)
 app.include_router(transcript_api.router)
 
 
-def extract_korean_word_candidates(input_text: str) -> list[dict]:
-    tokens = filter_korean_tokens(input_text)
-    print(f"{tokens=}")
-
-    candidate_words = extract_candidate_korean_words(tokens)
-    print(f"{candidate_words=}")
-
-    tagged_candidates = tag_if_derived_by_substring(candidate_words)
-    print(f"{tagged_candidates=}")
-    return tagged_candidates
-
-
-def select_base_korean_words(tagged_candidates: list[dict]) -> list[str]:
-    base_words = [
-        entry["korean"]
-        for entry in tagged_candidates
-        if not entry["is_derived"]
-    ]
-    print(f"{base_words=}")
-    return base_words
-
-
-def select_definition_words(tagged_candidates: list[dict]) -> list[str]:
-    derived_base_forms = {
-        entry["base_form"]
-        for entry in tagged_candidates
-        if entry["is_derived"]
-    }
-
-    definition_words = [
-        entry["korean"]
-        for entry in tagged_candidates
-        if entry["is_derived"] or entry["korean"] not in derived_base_forms
-    ]
+@app.on_event("startup")
+async def start_komoran_pool():
+    if komoran_pool.enabled:
+        await komoran_pool.warm_up()
+        komoran_pool.start_health_checks()
 
-    print(f"{definition_words=}")
-    return definition_words
 
+@app.on_event("shutdown")
+def stop_komoran_pool():
+    komoran_pool.shutdown()
 
-def build_analysis_result(
-    sentence_gloss: str,
-    romanized: str,
-    hanja_words: list[dict],
-    korean_word_info: list[dict],
-) -> dict:
-    return {
-        "sentence_gloss": sentence_gloss,
-        "romanization": romanized,
-        "hanja_words": hanja_words,
-        "word_info": korean_word_info,
-    }
 
+@app.get("/analyze-stream")
+async def analyze_stream(input: str):
+    return StreamingResponse(analyze_with_preanalysis(input), media_type="text/event-stream")
 
-async def analyze_generator(input_text: str):
-    # Step 1: Tokenize + tag candidate korean words with base / derived
-    await asyncio.sleep(0.5)
-    yield "event: progress\ndata: Tokenizing input...\n\n"
-    await asyncio.sleep(0.25)
-    yield "event: progress\ndata: Identifying idioms and meaningful Korean word candidates...\n\n"
-
-    tagged_candidates = extract_korean_word_candidates(input_text)
-    await asyncio.sleep(0.5)
-
-    # Step 2: Generate hanja matches for base korean words
-    yield "event: progress\ndata: Generating Hanja annotations for base Korean words...\n\n"
-
-    base_korean_words = select_base_korean_words(tagged_candidates)
-    hanja_words = generate_hanja_for_words(base_korean_words)
-    await asyncio.sleep(0.5)
-
-    # Step 3: Generate gloss and korean word information
-    yield "event: progress\ndata: Creating sentence gloss and Korean word definitions...\n\n"
-
-    derived_korean_words = select_definition_words(tagged_candidates)
-    sentence_gloss, korean_word_info = analyze_korean_sentence(
-        input_text, derived_korean_words
-    )
-    await asyncio.sleep(0.5)
-
-    # Step 4: Romanization
-    yield "event: progress\ndata: Generating romanization...\n\n"
-    romanized = romanize(input_text)
-    await asyncio.sleep(0.5)
-
-    # Step 5: Finalizing
-    yield "event: progress\ndata: Finalizing response...\n\n"
 
-    result = build_analysis_result(
-        sentence_gloss,
-        romanized,
-        hanja_words,
-        korean_word_info,
-    )
+@app.get("/metrics")
+def metrics():
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
 
-    yield f"event: result\ndata: {json.dumps(result, ensure_ascii=False)}\n\n"
 
+if DEBUG_TRACES_ENABLED:
 
-@app.get("/analyze-stream")
-async def analyze_stream(input: str):
-    return StreamingResponse(analyze_generator(input), media_type="text/event-stream")
+    @app.get("/debug/traces")
+    def debug_traces(limit: int = 20, traceId: str | None = None):
+        return get_recent_traces(limit, traceId)
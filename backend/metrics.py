@@ -0,0 +1,153 @@
+import time
+import threading
+from contextlib import contextmanager
+
+# -----------------------------------------------------------------------------
+# Minimal Prometheus-compatible metrics (text exposition format 0.0.4).
+# Every metric registers itself in REGISTRY; `render_metrics` serves /metrics.
+# -----------------------------------------------------------------------------
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+REGISTRY = []
+
+
+def escape_label_value(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{escape_label_value(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = tuple(labels[name] for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{format_labels(self.labelnames, key)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = buckets
+        # label values -> [per-bucket counts..., +Inf count, sum]
+        self._values: dict[tuple, list[float]] = {}
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(labels[name] for name in self.labelnames)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            else:
+                series[len(self.buckets)] += 1
+            series[-1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the wall time of the block; works around sync code and awaits alike."""
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started_at, **labels)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, series in sorted(self._values.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, series):
+                    cumulative += count
+                    labels = format_labels(self.labelnames, key, f'le="{bound}"')
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                total = cumulative + series[len(self.buckets)]
+                labels = format_labels(self.labelnames, key, 'le="+Inf"')
+                lines.append(f"{self.name}_bucket{labels} {total}")
+                labels = format_labels(self.labelnames, key)
+                lines.append(f"{self.name}_sum{labels} {series[-1]}")
+                lines.append(f"{self.name}_count{labels} {total}")
+        return lines
+
+
+def render_metrics() -> str:
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+### === KoEx metrics ===
+
+STAGE_LATENCY = Histogram(
+    "koex_stage_duration_seconds",
+    "Wall time of each pipeline stage and external call.",
+    ("stage",),
+)
+OPENAI_CALLS = Counter(
+    "koex_openai_calls_total",
+    "OpenAI API attempts by prompt type and outcome.",
+    ("prompt_type", "model", "outcome"),
+)
+OPENAI_RETRIES = Counter(
+    "koex_openai_retries_total",
+    "OpenAI attempts that were retried.",
+    ("prompt_type",),
+)
+OPENAI_CACHE_HITS = Counter(
+    "koex_openai_cache_hits_total",
+    "Completions served from the LLM response cache.",
+    ("prompt_type",),
+)
+OPENAI_PARSE_FAILURES = Counter(
+    "koex_openai_parse_failures_total",
+    "Completions that could not be parsed as JSON.",
+    ("prompt_type",),
+)
+OPENAI_TOKENS = Counter(
+    "koex_openai_tokens_total",
+    "Tokens reported by OpenAI usage, by prompt type.",
+    ("prompt_type", "kind"),
+)
+KOMORAN_POOL_RESTARTS = Counter(
+    "koex_komoran_pool_restarts_total",
+    "Times the Komoran worker pool was replaced after a crash or hang.",
+)
+KOMORAN_CACHE_LOOKUPS = Counter(
+    "koex_komoran_cache_lookups_total",
+    "Komoran memo lookups by level (sentence, eojeol) and outcome (hit, miss).",
+    ("level", "outcome"),
+)
@@ -0,0 +1,116 @@
+import os
+import time
+import uuid
+import random
+from collections import deque
+from contextvars import ContextVar
+
+# -----------------------------------------------------------------------------
+# Request-scoped debug traces (off unless DEBUG_TRACES_ENABLED=1: traces hold user
+# input and /debug/traces is unauthenticated).
+# A request is traced when sampled (TRACE_SAMPLE_RATE) or when it sends the
+# `X-Debug-Trace: 1` header. Untraced requests only pay a ContextVar lookup per
+# `trace_event` call: nothing is formatted, copied or written to stdout.
+# -----------------------------------------------------------------------------
+
+DEBUG_TRACES_ENABLED = os.getenv("DEBUG_TRACES_ENABLED", "0") == "1"
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "0"))
+TRACE_BUFFER_SIZE = int(os.getenv("TRACE_BUFFER_SIZE", "200"))
+
+TRACE_HEADER = b"x-debug-trace"
+TRACE_ID_HEADER = b"x-debug-trace-id"
+
+current_trace: ContextVar["Trace | None"] = ContextVar("current_trace", default=None)
+
+# most recent traces, oldest dropped first
+recent_traces: deque["Trace"] = deque(maxlen=TRACE_BUFFER_SIZE)
+
+
+class Trace:
+    def __init__(self, name: str):
+        self.id = uuid.uuid4().hex[:16]
+        self.name = name
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+        self.duration_ms = None
+        self.events: list[dict] = []
+
+    def add(self, label: str, value) -> None:
+        self.events.append(
+            {
+                "label": label,
+                "at_ms": round((time.perf_counter() - self._started) * 1000, 1),
+                "value": value,
+            }
+        )
+
+    def finish(self) -> None:
+        self.duration_ms = round((time.perf_counter() - self._started) * 1000, 1)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "started_at": self.started_at,
+            "duration_ms": self.duration_ms,
+            "events": self.events,
+        }
+
+
+def trace_event(label: str, value) -> None:
+    """Record an intermediate artifact on the current request's trace, if any."""
+    trace = current_trace.get()
+    if trace is not None:
+        trace.add(label, value)
+
+
+def is_tracing() -> bool:
+    """For call sites that must build the traced value first."""
+    return current_trace.get() is not None
+
+
+def should_trace(headers: list[tuple[bytes, bytes]]) -> bool:
+    if not DEBUG_TRACES_ENABLED:
+        return False
+    for name, value in headers:
+        if name == TRACE_HEADER:
+            return value not in (b"", b"0", b"false")
+    return TRACE_SAMPLE_RATE > 0 and random.random() < TRACE_SAMPLE_RATE
+
+
+class TraceMiddleware:
+    """Plain ASGI middleware, so the trace also covers streamed bodies and background tasks."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not should_trace(scope["headers"]):
+            await self.app(scope, receive, send)
+            return
+
+        query = scope.get("query_string", b"").decode("latin-1")
+        trace = Trace(f"{scope['method']} {scope['path']}" + (f"?{query}" if query else ""))
+        recent_traces.append(trace)
+
+        async def send_with_trace_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (TRACE_ID_HEADER, trace.id.encode()),
+                ]
+            await send(message)
+
+        token = current_trace.set(trace)
+        try:
+            await self.app(scope, receive, send_with_trace_id)
+        finally:
+            current_trace.reset(token)
+            trace.finish()
+
+
+def get_recent_traces(limit: int = 20, trace_id: str | None = None) -> list[dict]:
+    traces = list(reversed(recent_traces))
+    if trace_id is not None:
+        traces = [trace for trace in traces if trace.id == trace_id]
+    return [trace.to_dict() for trace in traces[:limit]]
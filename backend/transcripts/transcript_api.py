@@ -1,27 +1,29 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, BackgroundTasks, HTTPException
+from backend.analysis.preanalysis import PREANALYZE_TRANSCRIPTS, preanalyze_transcript_chunks
 from backend.transcripts.youtube_utils import get_parsed_transcript
 from backend.vector.qdrant_wrapper import embed_and_upsert
 from backend.gpt.openai_client import OpenAIClient
 
-router = APIRouter()
-openai_client = OpenAIClient.get_client()
-
 router = APIRouter()
 
 
 @router.get("/transcript")
-def get_transcript(videoUrl: str):
+def get_transcript(
+    videoUrl: str, background_tasks: BackgroundTasks, preanalyze: bool | None = None
+):
     try:
         chunks = get_parsed_transcript(videoUrl)
         embed_and_upsert(chunks, get_embedding)
 
+        # analyze chunks after the response is sent, so subtitle clicks become lookups
+        should_preanalyze = PREANALYZE_TRANSCRIPTS if preanalyze is None else preanalyze
+        if should_preanalyze:
+            background_tasks.add_task(preanalyze_transcript_chunks, chunks)
+
         return chunks
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 def get_embedding(text: str) -> list[float]:
-    response = openai_client.embeddings.create(
-        model="text-embedding-3-small", input=[text]
-    )
-    return response.data[0].embedding
\ No newline at end of file
+    return OpenAIClient.embed(text)
\ No newline at end of file
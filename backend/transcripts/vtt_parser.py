@@ -17,6 +17,10 @@ def time_str_to_seconds(s: str) -> float:
 
 
 def parse_vtt_file(vtt_path):
+    return chunk_by_sentences(read_vtt_segments(vtt_path))
+
+
+def read_vtt_segments(vtt_path):
     with open(vtt_path, encoding="utf-8") as f:
         lines = f.readlines()
 
@@ -50,7 +54,7 @@ def parse_vtt_file(vtt_path):
         seg["start"] = time_str_to_seconds(seg["start"])
         seg["end"] = time_str_to_seconds(seg["end"])
 
-    return chunk_by_sentences(raw_segments)
+    return raw_segments
 
 
 # === Sentence-aware Chunking ===
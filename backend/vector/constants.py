@@ -3,3 +3,5 @@ import os
 COLLECTION_NAME = "youtube_transcript_chunks"
 VECTOR_DIM = 1536
 QDRANT_PATH = os.getenv("QDRANT_PATH", "qdrant_storage")
+# in-process, non-persistent collection (e.g. for load tests)
+QDRANT_IN_MEMORY = os.getenv("QDRANT_IN_MEMORY", "0") == "1"
@@ -6,15 +6,11 @@ from backend.gpt.openai_client import OpenAIClient
 from backend.vector.constants import VECTOR_DIM
 
 TRANSCRIPTS_DIR = Path("backend/transcripts/youtube/parsed")
-openai_client = OpenAIClient.get_client()
 
 
 def get_embedding(text: str) -> list[float]:
     try:
-        response = openai_client.embeddings.create(
-            model="text-embedding-3-small", input=[text]
-        )
-        return response.data[0].embedding
+        return OpenAIClient.embed(text)
     except Exception as e:
         print(f"[ERROR] Failed to embed: {e}")
         return [0.0] * VECTOR_DIM
@@ -3,10 +3,18 @@ import numpy as np
 
 from qdrant_client import QdrantClient
 from qdrant_client.http.models import Distance, VectorParams, PointStruct
-from backend.vector.constants import COLLECTION_NAME, VECTOR_DIM, QDRANT_PATH
+from backend.vector.constants import (
+    COLLECTION_NAME,
+    QDRANT_IN_MEMORY,
+    QDRANT_PATH,
+    VECTOR_DIM,
+)
+from backend.metrics import STAGE_LATENCY
 from typing import List
 
-client = QdrantClient(path=QDRANT_PATH)
+client = (
+    QdrantClient(location=":memory:") if QDRANT_IN_MEMORY else QdrantClient(path=QDRANT_PATH)
+)
 
 
 def ensure_collection():
@@ -38,12 +46,14 @@ def embed_and_upsert(chunks: List[dict], embed_fn):
                 },
             )
         )
-    client.upsert(collection_name=COLLECTION_NAME, points=points)
+    with STAGE_LATENCY.time(stage="qdrant_upsert"):
+        client.upsert(collection_name=COLLECTION_NAME, points=points)
 
 
 def search(query_vector: List[float], top_k=5):
     ensure_collection()
-    results = client.search(
-        collection_name=COLLECTION_NAME, query_vector=query_vector, limit=top_k
-    )
+    with STAGE_LATENCY.time(stage="qdrant_search"):
+        results = client.search(
+            collection_name=COLLECTION_NAME, query_vector=query_vector, limit=top_k
+        )
     return results
@@ -2,19 +2,15 @@ from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 from backend.gpt.openai_client import OpenAIClient
 from backend.vector.qdrant_wrapper import search
+from backend.tracing import is_tracing, trace_event
 
 router = APIRouter()
 
 
 @router.get("/search")
 def semantic_search(query: str, videoId: str, start: float):
-    client = OpenAIClient.get_client()
     try:
-        embedding = (
-            client.embeddings.create(model="text-embedding-3-small", input=[query])
-            .data[0]
-            .embedding
-        )
+        embedding = OpenAIClient.embed(query)
     except Exception as e:
         return {"error": f"Embedding failed: {str(e)}"}
 
@@ -23,9 +19,10 @@ def semantic_search(query: str, videoId: str, start: float):
     except Exception as e:
         return {"error": f"Qdrant search failed: {str(e)}"}
 
-    print(f"Chunk: {query}")
-    print(f"Top hits: {[hit.payload['text'] for hit in results]}")
-    print("Raw scores:", [hit.score for hit in results])
+    if is_tracing():
+        trace_event("query", query)
+        trace_event("top_hits", [hit.payload.get("text") for hit in results])
+        trace_event("raw_scores", [hit.score for hit in results])
 
     response_items = []
 